@@ -28,10 +28,13 @@ Example:
 """
 
 import os
+import gzip
 import time
 import logging
 import json
-from typing import List, Dict, Any, Optional, Iterator
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator, Union
 from urllib.parse import urljoin
 
 try:
@@ -43,6 +46,31 @@ except ImportError as e:
         "requests library is required. Install with: pip install requests"
     ) from e
 
+# Optional: C++ fuzzy matching for model name suggestions (falls back to difflib)
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_fuzz = _rf_process = None
+
+# Optional: orjson for faster JSON-RPC encoding/decoding (falls back to json)
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Optional: httpx + h2 for HTTP/2 multiplexing (opt-in via http2=True)
+try:
+    import httpx
+    import h2  # noqa: F401  (needed by httpx for HTTP/2)
+except ImportError:
+    httpx = None
+
 # Bug Prevention #5: Support both package and standalone imports
 try:
     from .base import BaseDriver, DriverCapabilities, PaginationStyle
@@ -73,6 +101,35 @@ except ImportError:
     )
 
 
+# Domain element types accepted by _validate_domain
+_LOGICAL_OPERATORS = frozenset(("&", "|", "!"))
+_CONDITION_TYPES = (list, tuple)
+
+# Request bodies are pre-encoded, so requests won't add Content-Type itself
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+# Request bodies smaller than this are not worth compressing
+_COMPRESS_MIN_BYTES = 4096
+
+# JSON-RPC error message/name patterns -> (exception class, message prefix).
+# Checked in order; anything unmatched is raised as ConnectionError.
+_RPC_ERROR_PATTERNS = (
+    (re.compile(r"Access ?Denied", re.IGNORECASE), AuthenticationError, "Access denied"),
+    (re.compile(r"ValidationError|UserError"), ValidationError, "Validation failed"),
+)
+
+# Stand-in for the model name in the pre-encoded _model_exists request
+_MODEL_PLACEHOLDER = "\x00model\x00"
+
+# Transport errors from whichever HTTP client backs the session
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECTION_ERRORS += (httpx.TransportError,)
+
+
 class OdooDriver(BaseDriver):
     """
     Odoo External RPC API Driver
@@ -92,7 +149,8 @@ class OdooDriver(BaseDriver):
         timeout: Request timeout in seconds
         max_retries: Maximum retry attempts
         debug: Enable debug logging
-        session: Reusable requests.Session for connection pooling
+        http2: Whether the session is an HTTP/2 httpx.Client
+        session: Reusable requests.Session (or httpx.Client) for connection pooling
     """
 
     def __init__(
@@ -103,6 +161,8 @@ class OdooDriver(BaseDriver):
         timeout: int = 30,
         max_retries: int = 3,
         debug: bool = False,
+        http2: bool = False,
+        compress_requests: bool = False,
         **kwargs
     ):
         """
@@ -118,6 +178,12 @@ class OdooDriver(BaseDriver):
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum retry attempts on rate limit (default: 3)
             debug: Enable debug logging (default: False)
+            http2: Use an HTTP/2 httpx.Client so concurrent calls share one
+                connection (default: False). Requires ``httpx[http2]``;
+                falls back to requests if it is not installed.
+            compress_requests: Gzip request bodies larger than 4 KB
+                (default: False). Only enable when the server or reverse
+                proxy in front of Odoo accepts Content-Encoding: gzip.
             **kwargs: Additional options
 
         Raises:
@@ -137,6 +203,9 @@ class OdooDriver(BaseDriver):
         # Initialize driver-specific attributes before parent attributes
         self.database = database
         self.driver_name = "OdooDriver"
+        self._fields_cache: Dict[str, Dict[str, Any]] = {}
+        self._model_exists_template = None
+        self.session = None  # Set in phase 3; close() checks for None
 
         # Setup logging
         if debug:
@@ -154,6 +223,14 @@ class OdooDriver(BaseDriver):
         self.max_retries = max_retries or 3
         self.debug = debug
 
+        self.compress_requests = compress_requests
+        self.http2 = http2 and httpx is not None
+        if http2 and not self.http2:
+            self.logger.warning(
+                "http2=True requires httpx with HTTP/2 support "
+                "(pip install 'httpx[http2]'); falling back to requests"
+            )
+
         # ===== PHASE 3: Create session =====
         # Session creation can now use all attributes set above
         self.session = self._create_session()
@@ -300,6 +377,8 @@ class OdooDriver(BaseDriver):
         Get complete field schema for an Odoo model.
 
         Queries ir.model.fields to get all field definitions and metadata.
+        Schemas are cached per model for the lifetime of the driver; call
+        clear_fields_cache() after installing modules or adding fields.
 
         Args:
             object_name: Odoo model name (e.g., "res.partner")
@@ -331,6 +410,10 @@ class OdooDriver(BaseDriver):
                 'relation': None
             }
         """
+        cached = self._fields_cache.get(object_name)
+        if cached is not None:
+            return cached
+
         try:
             # Verify model exists
             if not self._model_exists(object_name):
@@ -385,9 +468,10 @@ class OdooDriver(BaseDriver):
                         "relation": None
                     }
 
+            self._fields_cache[object_name] = fields
             return fields
 
-        except ObjectNotFoundError:
+        except DriverError:
             raise
         except Exception as e:
             raise ConnectionError(
@@ -395,13 +479,29 @@ class OdooDriver(BaseDriver):
                 details={"model": object_name, "error": str(e)}
             )
 
+    def clear_fields_cache(self, object_name: Optional[str] = None) -> None:
+        """
+        Drop cached field schemas so the next get_fields() call refetches them.
+
+        Args:
+            object_name: Model to forget (default: all cached models)
+
+        Example:
+            >>> driver.clear_fields_cache("res.partner")
+        """
+        if object_name is None:
+            self._fields_cache.clear()
+        else:
+            self._fields_cache.pop(object_name, None)
+
     # ===== Read Operations =====
 
     def read(
         self,
-        query: str,
+        query: Union[str, List[Any]],
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        order: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute a read query using Odoo Domain Language and return results.
@@ -409,9 +509,12 @@ class OdooDriver(BaseDriver):
         Executes a search_read operation on a model using Odoo domain syntax.
 
         Args:
-            query: Odoo domain string (e.g., "[['active', '=', True]]")
+            query: Odoo domain as a string (e.g., '[["active", "=", true]]')
+                or as a Python list (e.g., [["active", "=", True]]). Lists
+                are used as-is, skipping string parsing.
             limit: Maximum number of records to return (default: 80)
             offset: Number of records to skip (default: 0)
+            order: Sort specification (e.g., "id asc"); server default if None
 
         Returns:
             List of record dictionaries with all fields
@@ -441,32 +544,13 @@ class OdooDriver(BaseDriver):
                 offset = 0
 
             # Parse and validate domain
-            try:
-                domain_list = json.loads(query) if isinstance(query, str) else query
-            except json.JSONDecodeError as e:
-                raise QuerySyntaxError(
-                    f"Invalid domain syntax: {str(e)}",
-                    details={
-                        "query": query,
-                        "error": str(e),
-                        "example": "[['active', '=', True], ['name', 'ilike', '%john%']]"
-                    }
-                )
-
-            # Validate domain structure
+            domain_list = self._parse_domain(query)
             self._validate_domain(domain_list)
 
             # Execute search_read
-            results = self._execute_kw(
-                model="res.partner",  # Default model for read
-                method="search_read",
-                args=[domain_list, []],  # Empty list = all fields
-                kwargs={"limit": limit, "offset": offset}
-            )
-
-            return results
+            return self._search_read(domain_list, limit=limit, offset=offset, order=order)
 
-        except (QuerySyntaxError, ConnectionError, RateLimitError):
+        except DriverError:
             raise
         except Exception as e:
             raise ConnectionError(
@@ -476,17 +560,30 @@ class OdooDriver(BaseDriver):
 
     def read_batched(
         self,
-        query: str,
-        batch_size: int = 80
+        query: Union[str, List[Any]],
+        batch_size: int = 80,
+        keyset: bool = True,
+        prefetch: bool = True
     ) -> Iterator[List[Dict[str, Any]]]:
         """
         Execute query and yield results in batches (memory-efficient).
 
-        Reads records in chunks using offset/limit pagination.
+        By default reads records using keyset pagination on ``id``: each batch
+        is fetched with ``['id', '>', last_id]`` appended to the domain and
+        ordered by ``id asc``, so the server never has to skip over rows
+        already returned. This keeps the cost of every page constant, while
+        offset pagination gets slower the deeper it goes.
+
+        While the caller processes a batch, the next one is already being
+        fetched on a background thread, so network time and processing time
+        overlap instead of adding up.
 
         Args:
-            query: Odoo domain string
+            query: Odoo domain string or list (see read())
             batch_size: Number of records per batch (default: 80, max: 1000)
+            keyset: Paginate on ``id`` (default: True). Set to False to use
+                offset/limit pagination with the server's default ordering.
+            prefetch: Fetch the next batch in the background (default: True)
 
         Yields:
             Batches of record dictionaries
@@ -504,26 +601,96 @@ class OdooDriver(BaseDriver):
         if batch_size > 1000:
             raise ValueError(f"batch_size cannot exceed 1000 (got: {batch_size})")
 
-        offset = 0
-        while True:
-            try:
-                batch = self.read(query, limit=batch_size, offset=offset)
+        # Parse and validate once, not on every page
+        domain = self._parse_domain(query)
+        self._validate_domain(domain)
 
-                if not batch:
-                    # No more records
-                    break
+        def fetch(after_id: Optional[int], page_offset: int) -> List[Dict[str, Any]]:
+            if not keyset:
+                return self._search_read(domain, limit=batch_size, offset=page_offset)
+            page_domain = domain if after_id is None else domain + [["id", ">", after_id]]
+            return self._search_read(page_domain, limit=batch_size, order="id asc")
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending: Optional[Future] = None
+        last_id = None
+        offset = 0
+        try:
+            batch = fetch(None, 0)
+            while batch:
+                is_last = len(batch) < batch_size
+                if not is_last:
+                    if keyset:
+                        last_id = batch[-1]["id"]
+                    offset += batch_size
+                    if executor is not None:
+                        # Start the next request before handing this batch out
+                        pending = executor.submit(fetch, last_id, offset)
 
                 yield batch
 
-                if len(batch) < batch_size:
+                if is_last:
                     # Last batch (incomplete)
                     break
 
-                offset += batch_size
+                if pending is not None:
+                    batch = pending.result()
+                    pending = None
+                else:
+                    batch = fetch(last_id, offset)
+
+        except Exception as e:
+            self.logger.error(
+                f"Error reading batch after id {last_id}: {e}" if keyset
+                else f"Error reading batch at offset {offset}: {e}"
+            )
+            raise
+
+        finally:
+            if pending is not None:
+                # Consumer stopped early; drop the prefetched batch
+                pending.cancel()
+            if executor is not None:
+                # A prefetch already in flight can't be cancelled; wait for
+                # it so no request outlives the generator on self.session
+                executor.shutdown(wait=True)
+
+    def read_batched_columnar(
+        self,
+        query: Union[str, List[Any]],
+        batch_size: int = 80,
+        keyset: bool = True,
+        prefetch: bool = True
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Like read_batched(), but yield each batch as columns instead of rows.
+
+        Each batch is a dict mapping field name to a list of values (one per
+        record, in record order). This is the preferred shape for analytics
+        pipelines: it can be handed straight to ``pandas.DataFrame(batch)``
+        or converted to NumPy arrays per column.
 
-            except Exception as e:
-                self.logger.error(f"Error reading batch at offset {offset}: {e}")
-                raise
+        Args:
+            query: Odoo domain string or list (see read())
+            batch_size: Number of records per batch (default: 80, max: 1000)
+            keyset: Paginate on ``id`` (default: True)
+            prefetch: Fetch the next batch in the background (default: True)
+
+        Yields:
+            Batches as {field_name: [value, ...]} dictionaries
+
+        Example:
+            >>> for columns in driver.read_batched_columnar([["active", "=", True]]):
+            ...     print(f"{len(columns['id'])} records, ids {columns['id'][:3]}...")
+        """
+        for batch in self.read_batched(
+            query, batch_size=batch_size, keyset=keyset, prefetch=prefetch
+        ):
+            # search_read returns the same fields for every record
+            yield {
+                field_name: [record.get(field_name) for record in batch]
+                for field_name in batch[0]
+            }
 
     # ===== Write Operations =====
 
@@ -577,9 +744,7 @@ class OdooDriver(BaseDriver):
 
             return created_record[0] if created_record else {"id": record_id, **data}
 
-        except ObjectNotFoundError:
-            raise
-        except ValidationError:
+        except DriverError:
             raise
         except Exception as e:
             if "validation" in str(e).lower():
@@ -592,6 +757,85 @@ class OdooDriver(BaseDriver):
                 details={"model": object_name, "error": str(e)}
             )
 
+    def create_many(
+        self,
+        object_name: str,
+        records: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several Odoo records in a single call.
+
+        Odoo's create accepts a list of value dicts, so all records are
+        created in one round trip (and one server transaction) and read
+        back in a second one, instead of two round trips per record.
+
+        Args:
+            object_name: Model name (e.g., "res.partner")
+            records: Field values for each record
+
+        Returns:
+            Created records with IDs, in the same order as records
+
+        Raises:
+            ObjectNotFoundError: If model doesn't exist
+            ValidationError: If a record is malformed or validation fails
+            ConnectionError: If API request fails
+
+        Example:
+            >>> created = driver.create_many("res.partner", [
+            ...     {"name": "Company A"},
+            ...     {"name": "Company B"},
+            ... ])
+            >>> [r["id"] for r in created]
+            [42, 43]
+        """
+        # Reject malformed payloads before any network call
+        self._validate_records(object_name, records)
+        if not records:
+            return []
+
+        try:
+            if not self._model_exists(object_name):
+                raise ObjectNotFoundError(
+                    f"Model '{object_name}' not found",
+                    details={"model": object_name}
+                )
+
+            # Execute create (a list of vals returns a list of ids)
+            record_ids = self._execute_kw(
+                model=object_name,
+                method="create",
+                args=[records],
+                kwargs={}
+            )
+            if not isinstance(record_ids, list):
+                record_ids = [record_ids]
+
+            # Read created records to return full data
+            created_records = self._execute_kw(
+                model=object_name,
+                method="read",
+                args=[record_ids, []],
+                kwargs={}
+            )
+
+            if created_records:
+                return created_records
+            return [{"id": record_id, **data} for record_id, data in zip(record_ids, records)]
+
+        except DriverError:
+            raise
+        except Exception as e:
+            if "validation" in str(e).lower():
+                raise ValidationError(
+                    f"Validation failed when creating {object_name}: {str(e)}",
+                    details={"model": object_name, "count": len(records), "error": str(e)}
+                )
+            raise ConnectionError(
+                f"Failed to create records in {object_name}: {str(e)}",
+                details={"model": object_name, "count": len(records), "error": str(e)}
+            )
+
     def update(self, object_name: str, record_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing Odoo record.
@@ -645,7 +889,7 @@ class OdooDriver(BaseDriver):
 
             return updated[0] if updated else {"id": record_id_int, **data}
 
-        except (ObjectNotFoundError, ValidationError):
+        except DriverError:
             raise
         except Exception as e:
             raise ConnectionError(
@@ -694,7 +938,7 @@ class OdooDriver(BaseDriver):
 
             return True
 
-        except (ObjectNotFoundError, ValidationError):
+        except DriverError:
             raise
         except Exception as e:
             raise ConnectionError(
@@ -702,17 +946,80 @@ class OdooDriver(BaseDriver):
                 details={"model": object_name, "record_id": record_id, "error": str(e)}
             )
 
+    def delete_many(self, object_name: str, record_ids: List[Any]) -> bool:
+        """
+        Delete several Odoo records in a single call.
+
+        Odoo's unlink accepts a list of ids, so this costs one round trip
+        regardless of how many records are deleted.
+
+        CAUTION: Deletion is permanent. Agents should require explicit approval.
+
+        Args:
+            object_name: Model name
+            record_ids: Record IDs to delete
+
+        Returns:
+            True if successful
+
+        Raises:
+            ObjectNotFoundError: If model doesn't exist
+            ValidationError: If any record ID is invalid
+            ConnectionError: If API request fails
+
+        Example:
+            >>> driver.delete_many("res.partner", [42, 43, 44])
+            True
+        """
+        try:
+            # Convert record ids to integers
+            try:
+                ids = [int(record_id) for record_id in record_ids]
+            except (TypeError, ValueError):
+                raise ValidationError(
+                    f"Invalid record IDs: {record_ids}",
+                    details={"record_ids": record_ids}
+                )
+
+            if not ids:
+                return True
+
+            if not self._model_exists(object_name):
+                raise ObjectNotFoundError(f"Model '{object_name}' not found")
+
+            # Execute delete (unlink in Odoo)
+            self._execute_kw(
+                model=object_name,
+                method="unlink",
+                args=[ids],
+                kwargs={}
+            )
+
+            return True
+
+        except DriverError:
+            raise
+        except Exception as e:
+            raise ConnectionError(
+                f"Failed to delete records {record_ids} from {object_name}: {str(e)}",
+                details={"model": object_name, "record_ids": record_ids, "error": str(e)}
+            )
+
     # ===== Internal Methods =====
 
-    def _create_session(self) -> requests.Session:
+    def _create_session(self) -> Any:
         """
         Create HTTP session with authentication and retry strategy.
 
         Bug Prevention #1 & #2: Correct authentication header setup.
 
         Returns:
-            Configured requests.Session with auth headers
+            Configured requests.Session with auth headers, or an HTTP/2
+            httpx.Client when http2 is enabled
         """
+        if self.http2:
+            return self._create_http2_session()
+
         session = requests.Session()
 
         # Set headers that apply to ALL requests
@@ -741,6 +1048,37 @@ class OdooDriver(BaseDriver):
 
         return session
 
+    def _create_http2_session(self) -> Any:
+        """
+        Create an HTTP/2 httpx.Client with the same headers as _create_session.
+
+        All requests are multiplexed over a single connection, so concurrent
+        calls (e.g. read_batched prefetch) do not open extra sockets.
+
+        Returns:
+            Configured httpx.Client
+        """
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": f"{self.driver_name}-Python-Driver/1.0.0",
+        }
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        # httpx retries connection failures only (no status-based backoff)
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=self.max_retries,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+        )
+
+        return httpx.Client(
+            http2=True,
+            transport=transport,
+            headers=headers,
+            timeout=self.timeout
+        )
+
     def _validate_connection(self):
         """
         Validate connection at initialization (fail fast!).
@@ -764,7 +1102,11 @@ class OdooDriver(BaseDriver):
         except Exception as e:
             error_str = str(e)
 
-            if "401" in error_str or "Unauthorized" in error_str:
+            if (
+                isinstance(e, AuthenticationError)
+                or "401" in error_str
+                or "Unauthorized" in error_str
+            ):
                 raise AuthenticationError(
                     "Invalid API key or credentials. Check ODOO_API_KEY environment variable.",
                     details={
@@ -818,8 +1160,6 @@ class OdooDriver(BaseDriver):
             ConnectionError: If request fails
             RateLimitError: If rate limited
         """
-        url = urljoin(self.base_url, "/api/v1/call")
-
         # Build JSON-RPC request
         request_payload = {
             "jsonrpc": "2.0",
@@ -835,12 +1175,50 @@ class OdooDriver(BaseDriver):
         if self.debug:
             self.logger.debug(f"Request: {model}.{method} - {request_payload}")
 
+        return self._post_rpc(_json_dumps(request_payload), model, method)
+
+    def _post_rpc(self, body: bytes, model: str, method: str) -> Any:
+        """
+        POST an encoded JSON-RPC request body and parse the response.
+
+        Args:
+            body: Encoded JSON-RPC request
+            model: Model name (for error details)
+            method: Method name (for error details)
+
+        Returns:
+            Method result
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ConnectionError: If request fails
+            RateLimitError: If rate limited
+            TimeoutError: If request times out
+        """
+        url = urljoin(self.base_url, "/api/v1/call")
+
+        # Responses are compressed already: requests/httpx send
+        # Accept-Encoding for every codec they can decode
+        headers = _JSON_HEADERS
+        if self.compress_requests and len(body) > _COMPRESS_MIN_BYTES:
+            body = gzip.compress(body)
+            headers = _GZIP_JSON_HEADERS
+
         try:
-            response = self.session.post(
-                url,
-                json=request_payload,
-                timeout=self.timeout
-            )
+            if self.http2:
+                response = self.session.post(
+                    url,
+                    content=body,
+                    headers=headers,
+                    timeout=self.timeout
+                )
+            else:
+                response = self.session.post(
+                    url,
+                    data=body,
+                    headers=headers,
+                    timeout=self.timeout
+                )
 
             if self.debug:
                 self.logger.debug(f"Response status: {response.status_code}")
@@ -853,7 +1231,10 @@ class OdooDriver(BaseDriver):
 
             return response_data
 
-        except requests.exceptions.Timeout:
+        except DriverError:
+            # Already classified by _parse_response
+            raise
+        except _TIMEOUT_ERRORS:
             raise TimeoutError(
                 f"Request timed out after {self.timeout} seconds",
                 details={
@@ -862,7 +1243,7 @@ class OdooDriver(BaseDriver):
                     "method": method
                 }
             )
-        except requests.exceptions.ConnectionError as e:
+        except _CONNECTION_ERRORS as e:
             raise ConnectionError(
                 f"Connection error: {str(e)}",
                 details={"error": str(e), "url": url}
@@ -890,61 +1271,68 @@ class OdooDriver(BaseDriver):
             RateLimitError: If rate limited
             ConnectionError: If response is invalid
         """
+        # Handle HTTP error status codes first: error pages are often HTML,
+        # and successful responses never need the body as text
+        status_code = response.status_code
+        if status_code >= 400:
+            if status_code == 401:
+                raise AuthenticationError(
+                    "Authentication failed (401). Check API key.",
+                    details={"status_code": 401}
+                )
+
+            if status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 60))
+                raise RateLimitError(
+                    f"Rate limited. Retry after {retry_after} seconds.",
+                    details={"retry_after": retry_after, "status_code": 429}
+                )
+
+            if status_code >= 500:
+                snippet = response.content[:200].decode("utf-8", "replace")
+                raise ConnectionError(
+                    f"Server error ({status_code}): {snippet}",
+                    details={"status_code": status_code}
+                )
+
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except ValueError as e:
             raise ConnectionError(
                 f"Invalid JSON response: {str(e)}",
                 details={
-                    "status_code": response.status_code,
-                    "content": response.text[:500]
+                    "status_code": status_code,
+                    "content": response.content[:500].decode("utf-8", "replace")
                 }
             )
 
         if self.debug:
             self.logger.debug(f"Parsed response: {data}")
 
-        # Handle HTTP error status codes
-        if response.status_code == 401:
-            raise AuthenticationError(
-                "Authentication failed (401). Check API key.",
-                details={"status_code": 401}
-            )
-
-        if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-            raise RateLimitError(
-                f"Rate limited. Retry after {retry_after} seconds.",
-                details={"retry_after": retry_after, "status_code": 429}
-            )
-
-        if response.status_code >= 500:
-            raise ConnectionError(
-                f"Server error ({response.status_code}): {response.text[:200]}",
-                details={"status_code": response.status_code}
-            )
-
         # Check for JSON-RPC error in response
         if isinstance(data, dict):
             if "error" in data and data["error"] is not None:
                 error_info = data["error"]
                 error_msg = error_info.get("message", "Unknown error")
                 error_code = error_info.get("code", "unknown")
+                error_data = error_info.get("data")
+                details = {
+                    "error_code": error_code,
+                    "error_msg": error_msg,
+                    "error_data": error_data
+                }
 
-                if "AccessDenied" in error_msg or "Access denied" in error_msg:
-                    raise AuthenticationError(
-                        f"Access denied: {error_msg}",
-                        details={"error_code": error_code, "error_msg": error_msg}
-                    )
+                # Odoo puts the exception class (e.g. odoo.exceptions.AccessDenied)
+                # in data.name, with a generic top-level message
+                error_text = error_msg
+                if isinstance(error_data, dict) and error_data.get("name"):
+                    error_text = f"{error_msg} {error_data['name']}"
 
-                raise ConnectionError(
-                    f"Odoo error: {error_msg}",
-                    details={
-                        "error_code": error_code,
-                        "error_msg": error_msg,
-                        "error_data": error_info.get("data")
-                    }
-                )
+                for pattern, error_class, prefix in _RPC_ERROR_PATTERNS:
+                    if pattern.search(error_text):
+                        raise error_class(f"{prefix}: {error_msg}", details=details)
+
+                raise ConnectionError(f"Odoo error: {error_msg}", details=details)
 
             # Extract result field (case-sensitive!)
             if "result" in data:
@@ -974,16 +1362,96 @@ class OdooDriver(BaseDriver):
             True if model exists, False otherwise
         """
         try:
-            result = self._execute_kw(
-                model="ir.model",
-                method="search_read",
-                args=[[["model", "=", model_name]], ["id"]],
-                kwargs={"limit": 1}
-            )
+            # Called before every write, so only the model name is encoded
+            # per call; the rest of the request body is encoded once
+            if self._model_exists_template is None:
+                request_payload = {
+                    "jsonrpc": "2.0",
+                    "method": "call",
+                    "params": {
+                        "service": "object",
+                        "method": "execute_kw",
+                        "args": [
+                            self.database, self.api_key, "ir.model", "search_read",
+                            [[["model", "=", _MODEL_PLACEHOLDER]], ["id"]], {"limit": 1}
+                        ]
+                    },
+                    "id": 1
+                }
+                prefix, suffix = _json_dumps(request_payload).split(
+                    _json_dumps(_MODEL_PLACEHOLDER), 1
+                )
+                self._model_exists_template = (prefix, suffix)
+
+            prefix, suffix = self._model_exists_template
+            body = prefix + _json_dumps(model_name) + suffix
+
+            if self.debug:
+                self.logger.debug(f"Request: ir.model.search_read - {body!r}")
+
+            result = self._post_rpc(body, "ir.model", "search_read")
             return bool(result)
         except Exception:
             return False
 
+    def _parse_domain(self, query: Union[str, List[Any]]) -> Any:
+        """
+        Parse an Odoo domain string into a list.
+
+        Args:
+            query: Domain string, or an already-parsed domain
+
+        Returns:
+            Parsed domain
+
+        Raises:
+            QuerySyntaxError: If the domain string is not valid JSON
+        """
+        if not isinstance(query, str):
+            return query
+
+        try:
+            return json.loads(query)
+        except json.JSONDecodeError as e:
+            raise QuerySyntaxError(
+                f"Invalid domain syntax: {str(e)}",
+                details={
+                    "query": query,
+                    "error": str(e),
+                    "example": "[['active', '=', True], ['name', 'ilike', '%john%']]"
+                }
+            )
+
+    def _search_read(
+        self,
+        domain: List[Any],
+        limit: int,
+        offset: int = 0,
+        order: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute search_read with an already validated domain.
+
+        Args:
+            domain: Parsed Odoo domain
+            limit: Maximum number of records to return
+            offset: Number of records to skip
+            order: Sort specification (e.g., "id asc")
+
+        Returns:
+            List of record dictionaries
+        """
+        kwargs: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if order:
+            kwargs["order"] = order
+
+        return self._execute_kw(
+            model="res.partner",  # Default model for read
+            method="search_read",
+            args=[domain, []],  # Empty list = all fields
+            kwargs=kwargs
+        )
+
     def _validate_domain(self, domain: Any) -> None:
         """
         Validate Odoo domain syntax.
@@ -1004,34 +1472,74 @@ class OdooDriver(BaseDriver):
                 }
             )
 
-        # Basic validation of domain structure
+        # Basic validation of domain structure. Field conditions are by far
+        # the most common element, so they are checked first.
+        is_inst = isinstance
         for condition in domain:
-            if isinstance(condition, str) and condition in ["&", "|", "!"]:
-                # Logical operator
-                continue
-            elif isinstance(condition, (list, tuple)):
+            if is_inst(condition, _CONDITION_TYPES):
                 # Field condition
-                if len(condition) != 3:
-                    raise QuerySyntaxError(
-                        f"Domain condition must have 3 elements [field, operator, value], got {len(condition)}",
-                        details={
-                            "condition": condition,
-                            "length": len(condition),
-                            "example": "['name', '=', 'John']"
-                        }
-                    )
-            else:
+                if len(condition) == 3:
+                    continue
                 raise QuerySyntaxError(
-                    f"Invalid domain element: {condition}",
+                    f"Domain condition must have 3 elements [field, operator, value], got {len(condition)}",
                     details={
-                        "element": condition,
-                        "type": type(condition).__name__
+                        "condition": condition,
+                        "length": len(condition),
+                        "example": "['name', '=', 'John']"
                     }
                 )
+            if is_inst(condition, str) and condition in _LOGICAL_OPERATORS:
+                # Logical operator
+                continue
+            raise QuerySyntaxError(
+                f"Invalid domain element: {condition}",
+                details={
+                    "element": condition,
+                    "type": type(condition).__name__
+                }
+            )
+
+    def _validate_records(self, object_name: str, records: Any) -> None:
+        """
+        Check the shape of a batch of records before sending it.
+
+        Only structure is checked (dicts with string field names); field
+        values are validated by Odoo itself.
+
+        Args:
+            object_name: Model name (for error details)
+            records: Records to validate
+
+        Raises:
+            ValidationError: If records is not a list of non-empty dicts
+                with string keys
+        """
+        if not isinstance(records, list):
+            raise ValidationError(
+                "Records must be a list of dictionaries",
+                details={"model": object_name, "type": type(records).__name__}
+            )
+
+        is_inst = isinstance
+        for index, record in enumerate(records):
+            if not is_inst(record, dict) or not record:
+                raise ValidationError(
+                    f"Record {index} must be a non-empty dictionary",
+                    details={"model": object_name, "index": index, "record": record}
+                )
+            for field_name in record:
+                if not is_inst(field_name, str):
+                    raise ValidationError(
+                        f"Record {index} has a non-string field name: {field_name!r}",
+                        details={"model": object_name, "index": index, "field": field_name}
+                    )
 
     def _suggest_similar(self, requested: str, available: List[str], max_suggestions: int = 3) -> List[str]:
         """
-        Suggest similar model names using simple string matching.
+        Suggest similar model names using fuzzy string matching.
+
+        Uses rapidfuzz when installed (much faster on databases with
+        thousands of models), otherwise falls back to difflib.
 
         Args:
             requested: Requested model name
@@ -1041,6 +1549,16 @@ class OdooDriver(BaseDriver):
         Returns:
             List of similar model names
         """
+        if _rf_process is not None:
+            matches = _rf_process.extract(
+                requested,
+                available,
+                scorer=_rf_fuzz.WRatio,
+                limit=max_suggestions,
+                score_cutoff=60
+            )
+            return [match for match, _score, _index in matches]
+
         import difflib
 
         # Find close matches
@@ -1064,7 +1582,8 @@ class OdooDriver(BaseDriver):
             ... finally:
             ...     driver.close()
         """
-        if hasattr(self, "session") and self.session:
+        if self.session is not None:
             self.session.close()
+            self.session = None
             if self.debug:
                 self.logger.debug("Session closed")
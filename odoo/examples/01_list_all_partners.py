@@ -26,7 +26,7 @@ def main():
     try:
         # Query all active partners using domain language
         # Domain: [['active', '=', True]]
-        domain = "[['active', '=', True]]"
+        domain = [["active", "=", True]]
 
         partners = client.read(domain, limit=100)
 
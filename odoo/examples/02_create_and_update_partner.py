@@ -50,7 +50,7 @@ def main():
         print("Reading updated partner...")
 
         updated = client.read(
-            f"[['id', '=', {new_partner['id']}]]",
+            [["id", "=", new_partner['id']]],
             limit=1
         )
 
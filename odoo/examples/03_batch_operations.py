@@ -28,31 +28,30 @@ def main():
 
         print(f"Creating {len(companies)} partners...\n")
 
+        # One create call for all records instead of one per record
         created_ids = []
-        for i, company_data in enumerate(companies, 1):
-            try:
-                record = client.create("res.partner", company_data)
-                created_ids.append(record['id'])
+        try:
+            records = client.create_many("res.partner", companies)
+            created_ids = [record['id'] for record in records]
+            for i, record in enumerate(records, 1):
                 print(f"  [{i}/{len(companies)}] ✓ Created: {record['name']} (ID: {record['id']})")
 
-            except ValidationError as e:
-                print(f"  [{i}/{len(companies)}] ✗ Error: {e.message}")
+        except ValidationError as e:
+            print(f"  ✗ Error: {e.message}")
 
         print(f"\nSuccessfully created {len(created_ids)} partners: {created_ids}\n")
 
         # Query the newly created records
         print("Verifying created records...")
 
-        ids_str = ",".join(str(id) for id in created_ids)
-        domain = f"[['id', 'in', [{ids_str}]]]"
+        domain = [["id", "in", created_ids]]
 
         results = client.read(domain)
         print(f"✓ Found {len(results)} records in database\n")
 
         # Cleanup
         print("Cleaning up (deleting test records)...")
-        for record_id in created_ids:
-            client.delete("res.partner", str(record_id))
+        client.delete_many("res.partner", created_ids)
         print(f"✓ Deleted {len(created_ids)} test records\n")
 
     except Exception as e:
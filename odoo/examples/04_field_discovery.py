@@ -38,28 +38,24 @@ def main():
 
         print(f"Fields ({len(fields)} total):\n")
 
-        # Categorize fields
-        required_fields = []
-        readonly_fields = []
-        relation_fields = []
-
+        # Print field details in one write instead of a print() per line
+        lines = []
         for field_name, field_info in fields.items():
-            print(f"  {field_name}:")
-            print(f"    Type: {field_info['type']}")
-            print(f"    Label: {field_info['label']}")
-            print(f"    Required: {field_info['required']}")
-            print(f"    ReadOnly: {field_info['readonly']}")
-            if field_info.get('relation'):
-                print(f"    Relation: {field_info['relation']}")
-            print()
-
-            # Categorize
-            if field_info['required']:
-                required_fields.append(field_name)
-            if field_info['readonly']:
-                readonly_fields.append(field_name)
+            lines.append(f"  {field_name}:")
+            lines.append(f"    Type: {field_info['type']}")
+            lines.append(f"    Label: {field_info['label']}")
+            lines.append(f"    Required: {field_info['required']}")
+            lines.append(f"    ReadOnly: {field_info['readonly']}")
             if field_info.get('relation'):
-                relation_fields.append(field_name)
+                lines.append(f"    Relation: {field_info['relation']}")
+            lines.append("")
+        print("\n".join(lines))
+
+        # Categorize fields
+        items = list(fields.items())
+        required_fields = [name for name, info in items if info['required']]
+        readonly_fields = [name for name, info in items if info['readonly']]
+        relation_fields = [name for name, info in items if info.get('relation')]
 
         # Step 3: Show summary
         print("Field Summary:")
@@ -73,7 +69,7 @@ def main():
 
         if 'active' in fields and fields['active']['type'] == 'boolean':
             if 'customer' in fields and fields['customer']['type'] == 'boolean':
-                domain = "[['active', '=', True], ['customer', '=', True]]"
+                domain = [["active", "=", True], ["customer", "=", True]]
                 print(f"Query: {domain}")
 
                 partners = client.read(domain, limit=10)
@@ -3,7 +3,7 @@ Example 5: Pagination - Process large datasets efficiently
 
 This example demonstrates:
 - Using read_batched() for memory-efficient iteration
-- Pagination with limit/offset
+- Keyset pagination on id (constant cost per page)
 - Processing large result sets
 - Progress tracking
 """
@@ -21,7 +21,7 @@ def main():
         # Step 1: Query all records using batched reading
         print("Processing large dataset with pagination...\n")
 
-        domain = "[['active', '=', True]]"
+        domain = [["active", "=", True]]
         batch_size = 50
         total_processed = 0
         batch_count = 0
@@ -29,8 +29,8 @@ def main():
         print(f"Domain: {domain}")
         print(f"Batch size: {batch_size}\n")
 
-        # Step 2: Iterate through batches
-        for batch in client.read_batched(domain, batch_size=batch_size):
+        # Step 2: Iterate through batches (keyset pagination on id)
+        for batch in client.read_batched(domain, batch_size=batch_size, keyset=True):
             batch_count += 1
             total_processed += len(batch)
 
@@ -49,15 +49,21 @@ def main():
         print(f"  Total batches: {batch_count}")
         print(f"  Total records: {total_processed}\n")
 
-        # Step 3: Manual pagination (for comparison)
+        # Step 3: Manual keyset pagination (for comparison)
+        # Instead of a growing offset, ask for records after the last seen id,
+        # so the server never re-scans rows from previous pages.
         print("Manual pagination example:")
 
         limit = 100
-        offset = 0
+        last_id = 0
         page = 1
 
         while True:
-            page_results = client.read(domain, limit=limit, offset=offset)
+            page_results = client.read(
+                domain + [["id", ">", last_id]],
+                limit=limit,
+                order="id asc"
+            )
 
             print(f"  Page {page}: {len(page_results)} records")
 
@@ -65,7 +71,7 @@ def main():
                 # Last page (incomplete)
                 break
 
-            offset += limit
+            last_id = page_results[-1]["id"]
             page += 1
 
             if page > 5:
@@ -37,12 +37,10 @@ def example_1_authentication_error():
         print(f"  Details: {e.details}\n")
 
 
-def example_2_model_not_found():
+def example_2_model_not_found(client):
     """Handle model not found errors."""
     print("Example 2: Model Not Found\n")
 
-    client = OdooDriver.from_env()
-
     try:
         # Try to access non-existent model
         fields = client.get_fields("non.existent.model")
@@ -53,15 +51,11 @@ def example_2_model_not_found():
         print(f"  Suggestions: {e.details.get('suggestions', [])}")
         print(f"  Message: {e.message}\n")
 
-    client.close()
-
 
-def example_3_query_syntax_error():
+def example_3_query_syntax_error(client):
     """Handle query syntax errors."""
     print("Example 3: Query Syntax Error\n")
 
-    client = OdooDriver.from_env()
-
     try:
         # Invalid domain syntax (missing operator)
         results = client.read("[['name', 'John']]")
@@ -71,15 +65,11 @@ def example_3_query_syntax_error():
         print(f"  Message: {e.message}")
         print(f"  Details: {e.details}\n")
 
-    client.close()
-
 
-def example_4_validation_error():
+def example_4_validation_error(client):
     """Handle validation errors."""
     print("Example 4: Validation Error\n")
 
-    client = OdooDriver.from_env()
-
     try:
         # Try to create record with missing required field
         record = client.create("res.partner", {
@@ -95,15 +85,11 @@ def example_4_validation_error():
     except ObjectNotFoundError:
         print(f"  (Model check failed - skipping)\n")
 
-    client.close()
-
 
-def example_5_rate_limiting():
+def example_5_rate_limiting(client):
     """Handle rate limiting."""
     print("Example 5: Rate Limiting\n")
 
-    client = OdooDriver.from_env()
-
     try:
         # Simulate rate limit by reading many times
         for i in range(5):
@@ -115,15 +101,11 @@ def example_5_rate_limiting():
         print(f"  Message: {e.message}")
         print(f"  Retry after: {e.details.get('retry_after', 'unknown')} seconds\n")
 
-    client.close()
 
-
-def example_6_graceful_fallback():
+def example_6_graceful_fallback(client):
     """Gracefully handle errors with fallback."""
     print("Example 6: Graceful Fallback\n")
 
-    client = OdooDriver.from_env()
-
     # Try to get fields for a model, with fallback
     models_to_try = ["res.partner", "non.existent", "res.users"]
 
@@ -139,7 +121,6 @@ def example_6_graceful_fallback():
             print(f"  ✗ {model_name}: Error - {e}")
 
     print()
-    client.close()
 
 
 def main():
@@ -153,35 +134,27 @@ def main():
     # Example 1: Skip (would require invalid credentials)
     # example_1_authentication_error()
 
-    # Example 2: Model not found
-    try:
-        example_2_model_not_found()
-    except Exception as e:
-        print(f"  Error: {e}\n")
-
-    # Example 3: Query syntax error
-    try:
-        example_3_query_syntax_error()
-    except Exception as e:
-        print(f"  Error: {e}\n")
-
-    # Example 4: Validation error
-    try:
-        example_4_validation_error()
-    except Exception as e:
-        print(f"  Error: {e}\n")
-
-    # Example 5: Rate limiting
-    try:
-        example_5_rate_limiting()
-    except Exception as e:
-        print(f"  Error: {e}\n")
+    # One client for all remaining examples: a single login and session,
+    # and the fields cache carries over between examples
+    client = OdooDriver.from_env()
 
-    # Example 6: Graceful fallback
     try:
-        example_6_graceful_fallback()
-    except Exception as e:
-        print(f"  Error: {e}\n")
+        examples = [
+            example_2_model_not_found,      # Model not found
+            example_3_query_syntax_error,   # Query syntax error
+            example_4_validation_error,     # Validation error
+            example_5_rate_limiting,        # Rate limiting
+            example_6_graceful_fallback,    # Graceful fallback
+        ]
+
+        for example in examples:
+            try:
+                example(client)
+            except Exception as e:
+                print(f"  Error: {e}\n")
+
+    finally:
+        client.close()
 
     print("=" * 60)
     print("Examples complete!")
@@ -50,7 +50,14 @@ __author__ = "PostHog"
 __license__ = "MIT"
 
 from .client import PostHogDriver
-from .base import BaseDriver, DriverCapabilities, PaginationStyle
+from .base import (
+    BaseDriver,
+    Capability,
+    DriverCapabilities,
+    FieldSpec,
+    PaginationStyle,
+    RateLimit,
+)
 from .exceptions import (
     DriverError,
     AuthenticationError,
@@ -68,8 +75,11 @@ __all__ = [
     "PostHogDriver",
     # Base classes and data structures
     "BaseDriver",
+    "Capability",
     "DriverCapabilities",
+    "FieldSpec",
     "PaginationStyle",
+    "RateLimit",
     # Exceptions
     "DriverError",
     "AuthenticationError",
@@ -5,10 +5,221 @@ Defines the abstract base class and data structures that all drivers must implem
 This is the contract between agents and drivers.
 """
 
+import asyncio
+import functools
+from collections import namedtuple
+import json
+import random
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Iterator
-from enum import Enum
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Iterator, Tuple
+from enum import Enum, IntFlag
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+# Optional: orjson for faster JSON encoding/decoding (falls back to json)
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Optional: pyarrow for columnar results (read_arrow)
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Optional: ijson for incremental parsing of streamed responses (falls back
+# to decoding the whole body)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: httpx for the native async API (falls back to running the sync
+# methods in a thread pool)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional: h2 lets the async client multiplex concurrent requests over one
+# HTTP/2 connection
+try:
+    import h2  # noqa: F401  (needed by httpx for HTTP/2)
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+# slots=True needs Python 3.10+; older versions get a frozen dataclass only
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Live resources that are recreated (or lazily rebuilt) after unpickling
+_UNPICKLED_ATTRIBUTES = (
+    "session",
+    "_async_session",
+    "_validation_lock",
+    "_finalizer",
+    "_inflight",
+    "_inflight_lock",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _row_type(fields: Tuple[str, ...]):
+    """
+    Return the row class for a field shape (built once per shape).
+
+    Field names that aren't valid identifiers are renamed positionally
+    (_0, _1, ...); index access always works.
+    """
+    return namedtuple("Row", fields, rename=True)
+
+
+def _close_session(session):
+    """Finalizer callback: release a session's pooled connections."""
+    try:
+        session.close()
+    except Exception:
+        pass
+
+
+# Keep-alive connections held per host by the default session
+DEFAULT_POOL_SIZE = 10
+
+# Concurrent requests issued by the batch_read()/batch_write() fallbacks
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Pages fetched at once by aread_batched()
+DEFAULT_PAGE_CONCURRENCY = 8
+
+# Upper bound on the connect timeout, in seconds. Pooled connections are
+# reused, so a slow connect means an unreachable host; only the read
+# timeout needs the full timeout for large responses.
+DEFAULT_CONNECT_TIMEOUT = 5
+
+# Responses retried by _request_with_retry(), and the methods the session's
+# urllib3 Retry re-sends after a connection/read error
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+RETRY_METHODS = frozenset(("GET", "POST", "PUT", "PATCH", "DELETE"))
+
+# Decorrelated jitter bounds for _request_with_retry(), in seconds
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 30.0
+
+
+def _check_status(response) -> None:
+    """
+    response.raise_for_status() for either session backend.
+
+    Always raises requests' HTTPError, so callers handle errors the same
+    way whether the driver runs on requests or on httpx (http2=True).
+    """
+    if isinstance(response, requests.Response):
+        response.raise_for_status()
+    elif response.status_code >= 400:
+        raise requests.exceptions.HTTPError(
+            f"{response.status_code} {response.reason_phrase} for url: {response.url}",
+            response=response,
+        )
+
+
+def _next_retry_delay(delay: float) -> float:
+    """Decorrelated jitter: the next wait, drawn from the previous one."""
+    return min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, delay * 3))
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry whose exponential backoff is spread by +/-50% jitter
+    (and capped at RETRY_MAX_DELAY), so clients that lost their connections
+    together don't all reconnect in lockstep.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return min(RETRY_MAX_DELAY, backoff * random.uniform(0.5, 1.5))
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds from a Retry-After header, or None if absent/unparseable."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _memoize(attr: str):
+    """
+    Cache a no-argument discovery method's result on the instance.
+
+    The result is stored in self.__dict__[attr] on first call, so the
+    subclass implementation runs at most once per driver instance.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            try:
+                return self.__dict__[attr]
+            except KeyError:
+                result = self.__dict__[attr] = method(self)
+                return result
+
+        wrapper._memoized = True
+        return wrapper
+
+    return decorator
+
+
+def _memoize_fields(method):
+    """
+    Cache get_fields() results per object name on the instance.
+
+    Errors (e.g. ObjectNotFoundError) are not cached.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, object_name):
+        cache = self.__dict__.setdefault("_fields_cache", {})
+        try:
+            return cache[object_name]
+        except KeyError:
+            result = cache[object_name] = method(self, object_name)
+            return result
+
+    wrapper._memoized = True
+    return wrapper
+
+
+# Discovery methods whose answers are fixed for a driver's lifetime
+_MEMOIZED_METHODS = (
+    ("get_capabilities", _memoize("_capabilities")),
+    ("list_objects", _memoize("_objects")),
+    ("get_fields", _memoize_fields),
+)
 
 
 class PaginationStyle(Enum):
@@ -20,13 +231,81 @@ class PaginationStyle(Enum):
     PAGE_NUMBER = "page"  # Page-based (REST APIs)
 
 
-@dataclass
+class Capability(IntFlag):
+    """
+    Capability bits, one per DriverCapabilities flag.
+
+    Several capabilities can be tested with a single bitwise check
+    against driver.capability_mask.
+
+    Example:
+        >>> needed = Capability.WRITE | Capability.BATCH
+        >>> if driver.capability_mask & needed == needed:
+        ...     driver.batch_write("dashboards", records)
+    """
+
+    READ = 1
+    WRITE = 2
+    UPDATE = 4
+    DELETE = 8
+    BATCH = 16
+    STREAM = 32
+    TRANSACTIONS = 64
+    RELATIONSHIPS = 128
+
+
+# DriverCapabilities flag behind each Capability bit
+_CAPABILITY_FIELDS = (
+    (Capability.READ, "read"),
+    (Capability.WRITE, "write"),
+    (Capability.UPDATE, "update"),
+    (Capability.DELETE, "delete"),
+    (Capability.BATCH, "batch_operations"),
+    (Capability.STREAM, "streaming"),
+    (Capability.TRANSACTIONS, "supports_transactions"),
+    (Capability.RELATIONSHIPS, "supports_relationships"),
+)
+
+# Operation names answered by supports(), with method-name aliases
+_CAPABILITY_OPERATIONS = {
+    "read": Capability.READ,
+    "write": Capability.WRITE,
+    "create": Capability.WRITE,
+    "update": Capability.UPDATE,
+    "delete": Capability.DELETE,
+    "batch_operations": Capability.BATCH,
+    "batch": Capability.BATCH,
+    "streaming": Capability.STREAM,
+    "transactions": Capability.TRANSACTIONS,
+    "relationships": Capability.RELATIONSHIPS,
+}
+
+
+class _ItemAccess:
+    """Dict-style read access for dataclasses that replaced plain dicts."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__dataclass_fields__ else default
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DriverCapabilities:
     """
     What the driver can do.
 
     Used by agents to discover what operations are supported.
 
+    Instances are immutable and hashable, so a driver can return one
+    shared instance from get_capabilities(). On Python 3.10+ the class
+    uses __slots__ (no per-instance __dict__).
+
     Attributes:
         read: Can execute read/query operations
         write: Can create new records
@@ -59,6 +338,116 @@ class DriverCapabilities:
     supports_transactions: bool = False
     supports_relationships: bool = False
 
+    def as_mask(self) -> Capability:
+        """
+        Return the boolean flags as a Capability bitmask.
+
+        Example:
+            >>> mask = driver.get_capabilities().as_mask()
+            >>> Capability.WRITE in mask
+            True
+        """
+        mask = Capability(0)
+        for bit, name in _CAPABILITY_FIELDS:
+            if getattr(self, name):
+                mask |= bit
+        return mask
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class FieldSpec(_ItemAccess):
+    """
+    Schema of a single field, as returned by get_fields().
+
+    Typed attributes replace the per-field metadata dict. For code written
+    against the dict form, item access (spec["type"]) and spec.get(...)
+    still work.
+
+    Attributes:
+        type: Field type (string, integer, float, boolean, datetime, ...)
+        label: Human-readable name
+        required: Must be provided on create
+        nullable: Accepts None
+        max_length: Maximum length (for strings)
+        references: Referenced object (for foreign keys)
+        description: Short description of the field
+        enum: Allowed values, if restricted
+
+    Example:
+        >>> fields = driver.get_fields("dashboards")
+        >>> if fields["name"].required:
+        ...     print(f"name is a {fields['name'].type}")
+    """
+
+    type: str
+    label: str
+    required: bool = False
+    nullable: bool = True
+    max_length: Optional[int] = None
+    references: Optional[str] = None
+    description: Optional[str] = None
+    enum: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FieldSpec":
+        """Build a FieldSpec from a field metadata dictionary."""
+        enum = data.get("enum")
+        return cls(
+            type=data["type"],
+            label=data.get("label", ""),
+            required=data.get("required", False),
+            nullable=data.get("nullable", True),
+            max_length=data.get("max_length"),
+            references=data.get("references"),
+            description=data.get("description"),
+            enum=tuple(enum) if enum is not None else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the field metadata as a dictionary (omitting unset values)."""
+        data = {
+            "type": self.type,
+            "label": self.label,
+            "required": self.required,
+            "nullable": self.nullable,
+        }
+        for name in ("max_length", "references", "description", "enum"):
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class RateLimit(_ItemAccess):
+    """
+    Rate limit status, as returned by get_rate_limit_status().
+
+    Values are None when the API doesn't report them. For code written
+    against the dict form, status["remaining"] and status.get(...) still
+    work.
+
+    Attributes:
+        remaining: Requests remaining in the current window
+        limit: Total requests allowed per window
+        reset_at: ISO timestamp when the window resets
+        retry_after: Seconds to wait (if rate limited)
+
+    Example:
+        >>> status = driver.get_rate_limit_status()
+        >>> if status.remaining is not None and status.remaining < 10:
+        ...     print("Warning: fewer than 10 API calls left!")
+    """
+
+    remaining: Optional[int] = None
+    limit: Optional[int] = None
+    reset_at: Optional[str] = None
+    retry_after: Optional[int] = None
+
+
+# Shared "nothing reported" status; immutable, so safe to return everywhere
+EMPTY_RATE_LIMIT = RateLimit()
+
 
 class BaseDriver(ABC):
     """
@@ -71,12 +460,19 @@ class BaseDriver(ABC):
 
     Key principle: Driver documents HOW to write Python code. Agent generates it.
 
+    Discovery results (get_capabilities, list_objects, get_fields) don't
+    change within a session, so subclass implementations are wrapped
+    automatically and run at most once per instance (per object for
+    get_fields). close() and clear_fields_cache() drop the cached answers.
+
     Attributes:
         api_url: Base URL for API/database connection
         api_key: API key/token for authentication (optional)
         timeout: Request timeout in seconds
         max_retries: Number of retry attempts for failed requests
         debug: Enable debug logging
+        pool_size: Keep-alive connections kept per host
+        session: Pooled HTTP session shared by all requests
 
     Example:
         >>> driver = PostHogDriver.from_env()
@@ -86,6 +482,16 @@ class BaseDriver(ABC):
         >>> driver.close()
     """
 
+    # ijson path of the record array in a streamed response (_open_stream)
+    STREAM_ITEMS_PATH = "results.item"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, memoize in _MEMOIZED_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_memoized", False):
+                setattr(cls, name, memoize(method))
+
     def __init__(
         self,
         api_url: str,
@@ -93,6 +499,8 @@ class BaseDriver(ABC):
         timeout: int = 30,
         max_retries: int = 3,
         debug: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        validate: bool = True,
         **kwargs
     ):
         """
@@ -104,6 +512,10 @@ class BaseDriver(ABC):
             timeout: Request timeout in seconds (default: 30)
             max_retries: Number of retry attempts for rate limiting (default: 3)
             debug: Enable debug logging (default: False)
+            pool_size: Keep-alive connections kept per host (default: 10)
+            validate: Check the connection now (default: True). When False,
+                the check runs before the first operation instead, so
+                constructing the driver costs no network roundtrip.
             **kwargs: Driver-specific options
 
         Raises:
@@ -124,21 +536,31 @@ class BaseDriver(ABC):
                 self.timeout = timeout or 30
                 self.max_retries = max_retries or 3
                 self.debug = debug
+                self.pool_size = pool_size
 
-                # Phase 3: Create session
+                # Phase 3: Create session (closed on garbage collection)
                 self.session = self._create_session()
+                self._register_finalizer()
 
-                # Phase 4: Validate connection
-                self._validate_connection()
+                # Phase 4: Validate connection (or defer it)
+                if validate:
+                    self._ensure_validated()
         """
         self.api_url = api_url
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.debug = debug
+        self.pool_size = pool_size
+
+        # One pooled session for the driver's lifetime, so every request
+        # reuses a keep-alive connection instead of a fresh TCP+TLS handshake
+        self.session = self._create_session()
+        self._register_finalizer()
 
-        # Validate credentials at init time (fail fast!)
-        self._validate_connection()
+        # Validate credentials at init time (fail fast!), unless deferred
+        if validate:
+            self._ensure_validated()
 
     @classmethod
     def from_env(cls, **kwargs) -> "BaseDriver":
@@ -178,6 +600,42 @@ class BaseDriver(ABC):
         """
         pass
 
+    @property
+    def capability_mask(self) -> Capability:
+        """
+        Capabilities as a Capability bitmask (computed once per instance).
+
+        Example:
+            >>> if driver.capability_mask & Capability.DELETE:
+            ...     print("Driver can delete records")
+        """
+        mask = self.__dict__.get("_capability_mask")
+        if mask is None:
+            mask = self._capability_mask = self.get_capabilities().as_mask()
+        return mask
+
+    def supports(self, operation: str) -> bool:
+        """
+        Check whether an operation is supported, without calling it.
+
+        Answers from capability_mask, which is built once per instance, so
+        each check is a dict lookup and a bitwise AND.
+
+        Args:
+            operation: Capability flag or method name: "read", "write" /
+                "create", "update", "delete", "batch", "streaming",
+                "transactions", "relationships"
+
+        Returns:
+            True if the driver supports the operation
+
+        Example:
+            >>> if driver.supports("create"):
+            ...     driver.create("dashboards", {"name": "My Dashboard"})
+        """
+        bit = _CAPABILITY_OPERATIONS.get(operation)
+        return bit is not None and bool(self.capability_mask & bit)
+
     # Discovery Methods (REQUIRED)
 
     @abstractmethod
@@ -196,7 +654,7 @@ class BaseDriver(ABC):
         pass
 
     @abstractmethod
-    def get_fields(self, object_name: str) -> Dict[str, Any]:
+    def get_fields(self, object_name: str) -> Dict[str, FieldSpec]:
         """
         Get complete field schema for an object.
 
@@ -204,16 +662,16 @@ class BaseDriver(ABC):
             object_name: Name of object (case-sensitive!)
 
         Returns:
-            Dictionary with field definitions:
+            Dictionary mapping field names to FieldSpec:
             {
-                "field_name": {
-                    "type": "string|integer|float|boolean|datetime|...",
-                    "label": "Human-readable name",
-                    "required": bool,
-                    "nullable": bool,
-                    "max_length": int (for strings),
-                    "references": str (for foreign keys)
-                }
+                "field_name": FieldSpec(
+                    type="string|integer|float|boolean|datetime|...",
+                    label="Human-readable name",
+                    required=bool,
+                    nullable=bool,
+                    max_length=int (for strings),
+                    references=str (for foreign keys)
+                )
             }
 
         Raises:
@@ -226,6 +684,48 @@ class BaseDriver(ABC):
         """
         pass
 
+    def get_all_fields(
+        self,
+        objects: Optional[List[str]] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> Dict[str, Dict[str, FieldSpec]]:
+        """
+        Get field schemas for many objects in one call.
+
+        Schemas not cached yet are fetched concurrently (at most
+        max_concurrency at a time) instead of one get_fields() roundtrip
+        after another; results land in the get_fields() cache.
+
+        Args:
+            objects: Object names (default: all of list_objects())
+            max_concurrency: Maximum lookups in flight (default: 10,
+                capped at pool_size)
+
+        Returns:
+            Dictionary mapping object name to its field schema
+
+        Raises:
+            ObjectNotFoundError: If an object doesn't exist
+
+        Example:
+            >>> schemas = driver.get_all_fields()
+            >>> for name, fields in schemas.items():
+            ...     print(name, list(fields))
+        """
+        if objects is None:
+            objects = self.list_objects()
+
+        cache = self.__dict__.get("_fields_cache") or {}
+        missing = [name for name in dict.fromkeys(objects) if name not in cache]
+
+        if len(missing) > 1:
+            # Warm the cache concurrently; the lookups below are then free
+            workers = self._worker_count(max_concurrency, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self.get_fields, missing))
+
+        return {name: self.get_fields(name) for name in objects}
+
     # Read Operations (REQUIRED)
 
     @abstractmethod
@@ -260,6 +760,80 @@ class BaseDriver(ABC):
         """
         pass
 
+    def read_rows(
+        self,
+        query: str,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[tuple]:
+        """
+        Execute a read query and return rows as named tuples.
+
+        When the fields you need are known up front, this avoids keeping a
+        dict per record: each record is projected onto a Row type built
+        once per field list (and reused across calls), so rows are compact
+        tuples with attribute access. Missing fields are None.
+
+        Args:
+            query: Query in driver's native language
+            fields: Field names to keep, in row order
+            limit: Maximum number of records to return
+            offset: Number of records to skip (for pagination)
+
+        Returns:
+            List of Row named tuples
+
+        Example:
+            >>> rows = driver.read_rows("/dashboards", ["id", "name"])
+            >>> for row in rows:
+            ...     print(row.id, row.name)
+        """
+        fields = tuple(fields)
+        make_row = _row_type(fields)._make
+        return [
+            make_row(map(record.get, fields))
+            for record in self.read(query, limit=limit, offset=offset)
+        ]
+
+    def read_arrow(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> "pa.Table":
+        """
+        Execute a read query and return results as a pyarrow.Table.
+
+        Columnar results use far less memory than a list of dicts, and
+        column operations (sum, filter, group by) run in C. Requires
+        pyarrow (pip install posthog-driver[arrow]).
+
+        The default converts the records from read(); drivers can
+        override it to decode responses straight into Arrow buffers.
+
+        Args:
+            query: Query in driver's native language
+            limit: Maximum number of records to return
+            offset: Number of records to skip (for pagination)
+
+        Returns:
+            pyarrow.Table with one column per field
+
+        Raises:
+            ImportError: If pyarrow is not installed
+
+        Example:
+            >>> table = driver.read_arrow("/events", limit=100)
+            >>> print(table.num_rows, table.column_names)
+        """
+        if pa is None:
+            raise ImportError(
+                "read_arrow() requires pyarrow. Install it with: "
+                "pip install posthog-driver[arrow]"
+            )
+        return pa.Table.from_pylist(self.read(query, limit=limit, offset=offset))
+
     # Write Operations (OPTIONAL - depends on capabilities)
 
     def create(self, object_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -336,6 +910,101 @@ class BaseDriver(ABC):
         """
         raise NotImplementedError("Delete operations not supported by this driver")
 
+    # Batch Operations (OPTIONAL - depends on capabilities)
+
+    def batch_read(
+        self,
+        object_name: str,
+        ids: List[str],
+        fields: Optional[List[str]] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch many records by ID.
+
+        The default implementation fetches records concurrently with
+        _fetch_record() over the pooled session, at most max_concurrency
+        at a time. Drivers whose API has a bulk lookup endpoint should
+        override this and fetch each page in one request.
+
+        Args:
+            object_name: Name of object
+            ids: Record IDs to fetch
+            fields: Only keep these fields in each record (optional)
+            max_concurrency: Maximum requests in flight (default: 10,
+                capped at pool_size)
+
+        Returns:
+            Records in the same order as ids
+
+        Raises:
+            NotImplementedError: If driver doesn't support fetching by ID
+            ObjectNotFoundError: If a record doesn't exist
+
+        Example:
+            >>> dashboards = driver.batch_read("dashboards", ["1", "2", "3"])
+            >>> for dashboard in dashboards:
+            ...     print(dashboard['name'])
+        """
+        if not ids:
+            return []
+
+        def fetch(record_id):
+            record = self._fetch_record(object_name, record_id)
+            if fields is not None:
+                record = {name: record.get(name) for name in fields}
+            return record
+
+        workers = self._worker_count(max_concurrency, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, ids))
+
+    def batch_write(
+        self,
+        object_name: str,
+        records: List[Dict[str, Any]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many records.
+
+        The default implementation calls create() concurrently, at most
+        max_concurrency at a time. Drivers whose API has a bulk create
+        endpoint should override this and send each page in one request.
+
+        Args:
+            object_name: Name of object to create
+            records: Field values for each record
+            max_concurrency: Maximum requests in flight (default: 10,
+                capped at pool_size)
+
+        Returns:
+            Created records in the same order as records
+
+        Raises:
+            NotImplementedError: If driver doesn't support write operations
+            ValidationError: If a record is invalid
+
+        Note:
+            Records are not created atomically. If one fails, the error is
+            raised but records already created are kept.
+
+        Example:
+            >>> created = driver.batch_write("dashboards", [
+            ...     {"name": "Sales"},
+            ...     {"name": "Marketing"},
+            ... ])
+            >>> print([d['id'] for d in created])
+        """
+        if not records:
+            return []
+
+        workers = self._worker_count(max_concurrency, len(records))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda record: self.create(object_name, record), records)
+            )
+
     # Pagination / Streaming (OPTIONAL)
 
     def read_batched(
@@ -344,6 +1013,17 @@ class BaseDriver(ABC):
         """
         Execute query and yield results in batches (memory-efficient).
 
+        The default implementation streams the whole result when the
+        driver provides _open_stream(): records are parsed incrementally
+        from the response body and yielded batch_size at a time, so the
+        full response is never held in memory. Otherwise it picks a
+        strategy from get_capabilities().pagination:
+        - CURSOR: follows the server's cursor with _read_page(), so each
+          page continues where the last one stopped instead of re-running
+          the query with a growing offset
+        - OFFSET / PAGE_NUMBER: calls read() with limit/offset
+        Only one batch is held in memory at a time.
+
         Args:
             query: Query in driver's native language
             batch_size: Number of records per batch
@@ -351,6 +1031,9 @@ class BaseDriver(ABC):
         Yields:
             Batches of records as lists of dictionaries
 
+        Raises:
+            NotImplementedError: If driver doesn't support pagination
+
         Example:
             >>> for batch in driver.read_batched(
             ...     "SELECT * FROM events", batch_size=1000
@@ -361,7 +1044,19 @@ class BaseDriver(ABC):
             Agent generates code with this pattern.
             Python runtime handles iteration (not the agent!).
         """
-        raise NotImplementedError("Batched reading not supported by this driver")
+        response = self._open_stream(query)
+        if response is not None:
+            yield from self._iter_json_batches(response, batch_size)
+            return
+
+        pagination = self.get_capabilities().pagination
+
+        if pagination == PaginationStyle.CURSOR:
+            yield from self._read_batched_cursor(query, batch_size)
+        elif pagination in (PaginationStyle.OFFSET, PaginationStyle.PAGE_NUMBER):
+            yield from self._read_batched_offset(query, batch_size)
+        else:
+            raise NotImplementedError("Batched reading not supported by this driver")
 
     # Low-Level API (OPTIONAL - for REST APIs)
 
@@ -392,34 +1087,201 @@ class BaseDriver(ABC):
             ...     method="GET",
             ...     params={"limit": 50}
             ... )
+
+        Note:
+            Bodies are encoded and responses decoded with orjson when it
+            is installed (pip install posthog-driver[fast]), else json.
+        """
+        self._ensure_validated()
+
+        url = self._endpoint_url(endpoint)
+
+        body = None
+        if data is not None:
+            body = _json_dumps(data)
+            kwargs["headers"] = {**_JSON_HEADERS, **(kwargs.get("headers") or {})}
+
+        response = self._request_with_retry(
+            method, url, params=params, data=body, **kwargs
+        )
+        _check_status(response)
+
+        if not response.content:
+            return {}
+        return _json_loads(response.content)
+
+    # Async API (OPTIONAL)
+
+    async def acall_endpoint(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async version of call_endpoint().
+
+        Uses a pooled httpx.AsyncClient (created on first use, with the same
+        headers as the sync session, over HTTP/2 when h2 is installed) when
+        httpx is installed; otherwise runs call_endpoint() in the default
+        thread pool.
+
+        Example:
+            >>> results = await asyncio.gather(
+            ...     driver.acall_endpoint("/dashboards"),
+            ...     driver.acall_endpoint("/feature_flags"),
+            ... )
+            >>> await driver.aclose()
+        """
+        if httpx is None:
+            return await self._run_sync(
+                self.call_endpoint, endpoint, method, params, data, **kwargs
+            )
+
+        if not self.__dict__.get("_validated"):
+            await self._run_sync(self._ensure_validated)
+
+        url = self._endpoint_url(endpoint)
+
+        body = None
+        if data is not None:
+            body = _json_dumps(data)
+            kwargs["headers"] = {**_JSON_HEADERS, **(kwargs.get("headers") or {})}
+
+        response = await self._arequest_with_retry(
+            method, url, params=params, content=body, **kwargs
+        )
+        _check_status(response)
+
+        if not response.content:
+            return {}
+        return _json_loads(response.content)
+
+    async def aread(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of read().
+
+        The default runs read() in the default thread pool, so it never
+        blocks the event loop. Drivers can override it with a native
+        implementation on top of acall_endpoint().
+
+        Example:
+            >>> dashboards, flags = await asyncio.gather(
+            ...     driver.aread("/dashboards"),
+            ...     driver.aread("/feature_flags"),
+            ... )
         """
-        raise NotImplementedError("Low-level endpoint calls not supported by this driver")
+        return await self._run_sync(self.read, query, limit, offset)
+
+    async def aread_batched(
+        self,
+        query: str,
+        batch_size: int = 1000,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async version of read_batched().
+
+        The default pulls read_batched() pages one at a time in the default
+        thread pool, so concurrency is unused. Drivers whose pages can be
+        addressed up front override it to fetch up to concurrency pages at
+        once.
+
+        Example:
+            >>> async for batch in driver.aread_batched("/persons"):
+            ...     process_batch(batch)
+        """
+        batches = self.read_batched(query, batch_size)
+        done = object()
+        while True:
+            batch = await self._run_sync(next, batches, done)
+            if batch is done:
+                return
+            yield batch
+
+    async def abatch_read(
+        self,
+        object_name: str,
+        ids: List[str],
+        fields: Optional[List[str]] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of batch_read().
+
+        Fetches records concurrently with _afetch_record(), at most
+        max_concurrency at a time.
+
+        Returns:
+            Records in the same order as ids
+
+        Example:
+            >>> dashboards = await driver.abatch_read("dashboards", ["1", "2"])
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(record_id):
+            async with semaphore:
+                record = await self._afetch_record(object_name, record_id)
+            if fields is not None:
+                record = {name: record.get(name) for name in fields}
+            return record
+
+        return list(await asyncio.gather(*(fetch(record_id) for record_id in ids)))
+
+    async def aclose(self):
+        """
+        Close the async client (if one was created).
+
+        Call this before the event loop that used the driver shuts down;
+        close() only releases the sync session.
+
+        Example:
+            >>> try:
+            ...     await driver.aread("/dashboards")
+            ... finally:
+            ...     await driver.aclose()
+        """
+        async_session = self.__dict__.pop("_async_session", None)
+        if async_session is not None:
+            await async_session.aclose()
 
     # Utility Methods
 
-    def get_rate_limit_status(self) -> Dict[str, Any]:
+    def get_rate_limit_status(self) -> RateLimit:
         """
         Get current rate limit status (if supported by API).
 
         Returns:
-            {
-                "remaining": int,     # Requests remaining
-                "limit": int,         # Total limit
-                "reset_at": str,      # ISO timestamp when limit resets
-                "retry_after": int    # Seconds to wait (if rate limited)
-            }
+            RateLimit(
+                remaining=int,     # Requests remaining
+                limit=int,         # Total limit
+                reset_at=str,      # ISO timestamp when limit resets
+                retry_after=int    # Seconds to wait (if rate limited)
+            )
 
         Example:
             >>> status = driver.get_rate_limit_status()
-            >>> if status["remaining"] < 10:
+            >>> if status.remaining is not None and status.remaining < 10:
             ...     print("Warning: Only 10 API calls left!")
         """
-        return {"remaining": None, "limit": None, "reset_at": None, "retry_after": None}
+        return EMPTY_RATE_LIMIT
 
     def close(self):
         """
         Close connections and cleanup resources.
 
+        Drivers that are never closed still release their session when
+        garbage collected (see _register_finalizer()), but closing
+        explicitly frees the connections right away.
+
         Example:
             >>> driver = PostHogDriver.from_env()
             >>> try:
@@ -427,10 +1289,447 @@ class BaseDriver(ABC):
             ... finally:
             ...     driver.close()
         """
-        pass
+        finalizer = self.__dict__.pop("_finalizer", None)
+        if finalizer is not None:
+            finalizer()
+
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+            self.session = None
+
+        self.__dict__.pop("_capabilities", None)
+        self.__dict__.pop("_capability_mask", None)
+        self.__dict__.pop("_objects", None)
+        self.clear_fields_cache()
+
+    def __enter__(self) -> "BaseDriver":
+        """
+        Use the driver as a context manager; close() runs on exit.
+
+        Example:
+            >>> with PostHogDriver.from_env() as driver:
+            ...     results = driver.read("/dashboards")
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def clear_fields_cache(self, object_name: Optional[str] = None):
+        """
+        Drop cached get_fields() results.
+
+        Args:
+            object_name: Object to forget, or None to clear every object
+
+        Example:
+            >>> driver.clear_fields_cache("dashboards")
+            >>> fields = driver.get_fields("dashboards")  # fetched again
+        """
+        cache = self.__dict__.get("_fields_cache")
+        if not cache:
+            return
+        if object_name is None:
+            cache.clear()
+        else:
+            cache.pop(object_name, None)
+
+    # Pickle Support
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop live connections and locks before pickling.
+
+        Credentials, settings, the validated flag and memoized discovery
+        results (_capabilities, _objects, _fields_cache) are kept, so a
+        driver shipped to a worker process skips rediscovery.
+        """
+        state = self.__dict__.copy()
+        for name in _UNPICKLED_ATTRIBUTES:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore a pickled driver with a fresh pooled session."""
+        self.__dict__.update(state)
+        self.session = self._create_session()
+        self._register_finalizer()
 
     # Internal Methods
 
+    def _register_finalizer(self):
+        """
+        Close self.session when the driver is garbage collected.
+
+        Drivers that are dropped without close() (e.g. built inline by an
+        agent) would otherwise keep pooled sockets open until the session
+        itself is collected. The finalizer holds the session, not the
+        driver, so it doesn't keep the driver alive; close() runs it early.
+
+        The async client is not covered: it can only be closed from its
+        event loop, so use aclose().
+        """
+        session = getattr(self, "session", None)
+        if session is not None:
+            self._finalizer = weakref.finalize(self, _close_session, session)
+
+    def _coalesce(self, key: Tuple, func, *args) -> List[Dict[str, Any]]:
+        """
+        Run func(*args) once for concurrent callers with the same key.
+
+        The first caller performs the request; callers that arrive while it
+        is in flight wait for its result (or exception) instead of sending
+        an identical request. Nothing is cached after the request returns.
+
+        Args:
+            key: Hashable identity of the request, e.g. (url, limit, offset)
+            func: Function performing the request and returning records
+
+        Returns:
+            Records returned by func; waiters get their own copy of each
+            record dict (nested values are still shared)
+        """
+        lock = self.__dict__.setdefault("_inflight_lock", threading.Lock())
+        inflight = self.__dict__.setdefault("_inflight", {})
+
+        with lock:
+            future = inflight.get(key)
+            owner = future is None
+            if owner:
+                future = inflight[key] = Future()
+
+        if not owner:
+            return [dict(record) for record in future.result()]
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with lock:
+                inflight.pop(key, None)
+
+    def _ensure_validated(self):
+        """
+        Run _validate_connection() once per driver instance.
+
+        Called from __init__ (validate=True) or before the first operation
+        (validate=False). Thread-safe: concurrent first calls trigger a
+        single probe. A failed probe is retried on the next call.
+        """
+        if self.__dict__.get("_validated"):
+            return
+
+        lock = self.__dict__.setdefault("_validation_lock", threading.Lock())
+        with lock:
+            if not self.__dict__.get("_validated"):
+                self._validate_connection()
+                self._validated = True
+
+    def _open_stream(self, query: str) -> Optional[requests.Response]:
+        """
+        Start a streamed request returning the whole result (used by
+        read_batched()).
+
+        Drivers with an export-style endpoint return the response from
+        self.session.request(..., stream=True); records are then read from
+        the JSON path in STREAM_ITEMS_PATH. The default returns None, so
+        read_batched() paginates instead.
+        """
+        return None
+
+    def _iter_json_batches(
+        self, response: requests.Response, batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield records from a streamed JSON response in batches.
+
+        With ijson installed the body is parsed incrementally from the
+        socket, so memory stays O(batch_size); without it the body is
+        decoded in one go. The response is always closed.
+        """
+        try:
+            response.raise_for_status()
+
+            if ijson is not None:
+                response.raw.decode_content = True
+                records = ijson.items(
+                    response.raw, self.STREAM_ITEMS_PATH, use_float=True
+                )
+            else:
+                data = _json_loads(response.content)
+                for key in self.STREAM_ITEMS_PATH.split(".")[:-1]:
+                    data = (data.get(key) or []) if isinstance(data, dict) else []
+                records = data
+
+            batch = []
+            for record in records:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            response.close()
+
+    def _read_page(
+        self, query: str, batch_size: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch one page for cursor pagination (used by read_batched()).
+
+        Args:
+            query: Query in driver's native language
+            batch_size: Number of records per page
+            cursor: Cursor returned with the previous page (None for the first)
+
+        Returns:
+            (records, next_cursor) - next_cursor is None on the last page
+
+        Raises:
+            NotImplementedError: If driver doesn't support cursor pagination
+        """
+        raise NotImplementedError("Cursor pagination not supported by this driver")
+
+    def _read_batched_cursor(
+        self, query: str, batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages by following the server cursor until it runs out."""
+        cursor = None
+        while True:
+            records, cursor = self._read_page(query, batch_size, cursor)
+            if records:
+                yield records
+            if not cursor:
+                break
+
+    def _read_batched_offset(
+        self, query: str, batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages with limit/offset, stopping at the first short page."""
+        offset = 0
+        while True:
+            batch = self.read(query, limit=batch_size, offset=offset)
+            if not batch:
+                break
+
+            yield batch
+
+            if len(batch) < batch_size:
+                break
+            offset += len(batch)
+
+    def _get_async_session(self) -> "httpx.AsyncClient":
+        """
+        Return the pooled httpx.AsyncClient, creating it on first use.
+
+        Uses HTTP/2 when h2 is installed, so concurrent acall_endpoint()
+        requests share one multiplexed connection. Responses are
+        negotiated compressed (gzip/deflate, plus br when brotli is
+        installed) and decompressed transparently, as with the sync
+        requests session.
+        """
+        async_session = self.__dict__.get("_async_session")
+        if async_session is None:
+            pool_size = getattr(self, "pool_size", DEFAULT_POOL_SIZE)
+            session = getattr(self, "session", None)
+            connect, read = self._request_timeout()
+            async_session = httpx.AsyncClient(
+                headers=dict(session.headers) if session is not None else None,
+                timeout=httpx.Timeout(read, connect=connect),
+                transport=httpx.AsyncHTTPTransport(
+                    http2=_HTTP2_AVAILABLE,
+                    retries=self.max_retries,
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size,
+                    ),
+                ),
+            )
+            self._async_session = async_session
+        return async_session
+
+    async def _run_sync(self, func, *args, **kwargs):
+        """Run a blocking method in the default thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def _afetch_record(self, object_name: str, record_id: str) -> Dict[str, Any]:
+        """
+        Async version of _fetch_record() (used by abatch_read()).
+
+        The default runs _fetch_record() in the default thread pool.
+        """
+        return await self._run_sync(self._fetch_record, object_name, record_id)
+
+    def _request_timeout(self) -> Tuple[float, float]:
+        """
+        The (connect, read) timeout passed with every request.
+
+        Connect is capped at DEFAULT_CONNECT_TIMEOUT, so a dead host fails
+        fast while slow responses still get the full timeout. Built once
+        and cached as self._timeout.
+        """
+        timeout = self.__dict__.get("_timeout")
+        if timeout is None:
+            timeout = self._timeout = (
+                min(DEFAULT_CONNECT_TIMEOUT, self.timeout),
+                self.timeout,
+            )
+        return timeout
+
+    def _endpoint_url(self, endpoint: str) -> str:
+        """
+        Resolve an endpoint path against api_url (used by call_endpoint()).
+
+        Plain concatenation onto a cached prefix, rather than urljoin(),
+        which reparses api_url on every call and drops its last path
+        segment ("/api") when it has no trailing slash. Absolute URLs are
+        returned unchanged.
+        """
+        if endpoint.startswith(("https://", "http://")):
+            return endpoint
+        base = self.__dict__.get("_base")
+        if base is None:
+            base = self._base = self.api_url.rstrip("/") + "/"
+        return base + endpoint.lstrip("/")
+
+    def _request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on self.session, retrying rate limits and 5xx.
+
+        Waits use decorrelated jitter - each delay is drawn from
+        uniform(RETRY_BASE_DELAY, previous * 3), capped at RETRY_MAX_DELAY -
+        so clients that were throttled together don't all retry at the same
+        instant. A Retry-After header is honoured as the minimum wait.
+
+        Returns:
+            The last response; the caller checks its status as usual
+        """
+        kwargs.setdefault("timeout", self._request_timeout())
+        if isinstance(self.session, requests.Session):
+            send = self.session.request
+        else:
+            send = self._send_httpx
+
+        delay = RETRY_BASE_DELAY
+        for attempt in range(self.max_retries + 1):
+            response = send(method, url, **kwargs)
+            if (
+                response.status_code not in RETRY_STATUS_CODES
+                or attempt == self.max_retries
+            ):
+                return response
+
+            delay = _next_retry_delay(delay)
+            retry_after = _retry_after(response)
+            response.close()
+            time.sleep(delay if retry_after is None else max(delay, retry_after))
+        return response
+
+    def _send_httpx(self, method: str, url: str, **kwargs):
+        """
+        Send one request on an httpx.Client session (http2=True).
+
+        Accepts requests-style arguments and raises requests' exceptions,
+        so callers work unchanged on either backend.
+        """
+        if isinstance(kwargs.get("data"), bytes):
+            kwargs["content"] = kwargs.pop("data")
+        if isinstance(kwargs.get("timeout"), tuple):
+            connect, read = kwargs["timeout"]
+            kwargs["timeout"] = httpx.Timeout(read, connect=connect)
+        # Responses are always read in full; callers check the session type
+        # before relying on stream=True
+        kwargs.pop("stream", None)
+        try:
+            return self.session.request(method, url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    async def _arequest_with_retry(self, method: str, url: str, **kwargs):
+        """
+        Async version of _request_with_retry() on the httpx client.
+
+        Returns:
+            The last httpx.Response; the caller checks its status
+        """
+        async_session = self._get_async_session()
+        delay = RETRY_BASE_DELAY
+        for attempt in range(self.max_retries + 1):
+            response = await async_session.request(method, url, **kwargs)
+            if (
+                response.status_code not in RETRY_STATUS_CODES
+                or attempt == self.max_retries
+            ):
+                return response
+
+            delay = _next_retry_delay(delay)
+            retry_after = _retry_after(response)
+            await asyncio.sleep(delay if retry_after is None else max(delay, retry_after))
+        return response
+
+    def _worker_count(self, max_concurrency: int, tasks: int) -> int:
+        """
+        Size a thread pool for fanning requests out over self.session.
+
+        Capped at pool_size: extra threads would find every pooled
+        connection busy, open a throwaway connection (new TCP+TLS
+        handshake) and have it discarded with "Connection pool is full".
+        """
+        pool_size = getattr(self, "pool_size", DEFAULT_POOL_SIZE)
+        return max(1, min(max_concurrency, tasks, pool_size))
+
+    def _fetch_record(self, object_name: str, record_id: str) -> Dict[str, Any]:
+        """
+        Fetch a single record by ID (used by the batch_read() fallback).
+
+        Raises:
+            NotImplementedError: If driver doesn't support fetching by ID
+            ObjectNotFoundError: If record doesn't exist
+        """
+        raise NotImplementedError("Batch reads not supported by this driver")
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session shared by all requests.
+
+        Mounts one HTTPAdapter on both schemes so connections are kept alive
+        and reused (up to pool_size per host). The adapter only retries
+        connection/read errors; rate limits and server errors are retried
+        with jitter by _request_with_retry().
+
+        Subclasses usually override this to add authentication headers;
+        they should keep the pooled adapter.
+
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+
+        retry_strategy = JitteredRetry(
+            total=self.max_retries,
+            backoff_factor=RETRY_BASE_DELAY,
+            allowed_methods=RETRY_METHODS,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry_strategy,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
     def _validate_connection(self):
         """
         Validate connection at __init__ time (fail fast!).
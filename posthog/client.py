@@ -32,8 +32,8 @@ Usage:
     # Get field schema
     fields = driver.get_fields("dashboards")
 
-    # Execute read query
-    results = driver.read("SELECT * FROM dashboards LIMIT 10")
+    # Read a resource (query is an endpoint path)
+    results = driver.read("/dashboards", limit=10)
 
     # Create a new dashboard
     dashboard = driver.create("dashboards", {
@@ -45,19 +45,43 @@ Usage:
     driver.close()
 """
 
+import asyncio
 import logging
 import os
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Iterator
-from urllib.parse import urljoin
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Iterator, Set, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from requests.packages.urllib3.util import make_headers
 
 # Handle both package and standalone imports
 try:
-    from .base import BaseDriver, DriverCapabilities, PaginationStyle
+    from .base import (
+        BaseDriver,
+        DriverCapabilities,
+        FieldSpec,
+        PaginationStyle,
+        RateLimit,
+        DEFAULT_BATCH_CONCURRENCY,
+        DEFAULT_CONNECT_TIMEOUT,
+        DEFAULT_PAGE_CONCURRENCY,
+        DEFAULT_POOL_SIZE,
+        EMPTY_RATE_LIMIT,
+        JitteredRetry,
+        RETRY_BASE_DELAY,
+        RETRY_METHODS,
+        _JSON_HEADERS,
+        _json_dumps,
+        _json_loads,
+        _check_status,
+        _HTTP2_AVAILABLE,
+        httpx,
+        ijson,
+    )
     from .exceptions import (
         DriverError,
         AuthenticationError,
@@ -71,7 +95,28 @@ try:
     )
 except ImportError:
     # Running as standalone script
-    from base import BaseDriver, DriverCapabilities, PaginationStyle
+    from base import (
+        BaseDriver,
+        DriverCapabilities,
+        FieldSpec,
+        PaginationStyle,
+        RateLimit,
+        DEFAULT_BATCH_CONCURRENCY,
+        DEFAULT_CONNECT_TIMEOUT,
+        DEFAULT_PAGE_CONCURRENCY,
+        DEFAULT_POOL_SIZE,
+        EMPTY_RATE_LIMIT,
+        JitteredRetry,
+        RETRY_BASE_DELAY,
+        RETRY_METHODS,
+        _JSON_HEADERS,
+        _json_dumps,
+        _json_loads,
+        _check_status,
+        _HTTP2_AVAILABLE,
+        httpx,
+        ijson,
+    )
     from exceptions import (
         DriverError,
         AuthenticationError,
@@ -85,6 +130,346 @@ except ImportError:
     )
 
 
+# Shape of a valid read() query: an endpoint path such as "/dashboards" or
+# "environments/123/events/", optionally followed by a query string. Only
+# the path is checked; the query string is left for requests to encode, so
+# '/persons?search=john doe' and '/events?properties=[{"key": "x"}]' pass.
+# Checked locally so malformed queries (e.g. SQL text) fail without a roundtrip.
+_ENDPOINT_PATTERN = re.compile(r"/?[\w.{}-]+(?:/[\w.{}-]+)*/?(?:\?.*)?", re.DOTALL)
+
+# Compressions urllib3 can decode here: gzip and deflate, plus br when
+# brotli is installed (pip install posthog-driver[compression]). Only
+# these are advertised, since the body must be decodable.
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# read() offsets from which a one-time warning suggests read_batched()
+_DEEP_OFFSET = 10000
+
+
+# Status code -> factory for the exception _check_response() raises, called
+# as handler(driver, response, endpoint). Add entries here to map more codes.
+def _unauthorized(driver, response, endpoint: str) -> DriverError:
+    return AuthenticationError(
+        "Invalid PostHog API key. Check your credentials.",
+        details={
+            "status_code": 401,
+            "api_url": driver.api_url,
+            "suggestion": "Verify POSTHOG_API_KEY is correct",
+        },
+    )
+
+
+def _not_found(driver, response, endpoint: str) -> DriverError:
+    return ObjectNotFoundError(
+        f"Resource '{endpoint}' not found",
+        details={
+            "endpoint": endpoint,
+            "available": driver.OBJECTS,
+            "suggestion": "Use list_objects() to see available resources",
+        },
+    )
+
+
+def _rate_limited(driver, response, endpoint: str) -> DriverError:
+    retry_after = int(response.headers.get("Retry-After", 60))
+    return RateLimitError(
+        f"PostHog API rate limit exceeded. Retry after {retry_after} seconds.",
+        details={
+            "retry_after": retry_after,
+            "suggestion": "Wait and retry, or reduce request frequency",
+        },
+    )
+
+
+_ERROR_HANDLERS = {
+    401: _unauthorized,
+    404: _not_found,
+    429: _rate_limited,
+}
+
+# from_env() error details, copied into each AuthenticationError raised
+_FROM_ENV_ERROR_DETAILS = {
+    "required_env_vars": ["POSTHOG_API_KEY"],
+    "optional_env_vars": [
+        "POSTHOG_API_URL",
+        "POSTHOG_PROJECT_ID",
+        "POSTHOG_PROJECT_API_KEY",
+    ],
+    "suggestion": "export POSTHOG_API_KEY=your_personal_api_key",
+}
+
+# Pages with a smaller Content-Length are decoded in one go by iter_read()
+# even when ijson is installed (the whole body is small enough to hold,
+# and one orjson call is faster than ijson's event stream)
+_STREAM_MIN_BYTES = 256 * 1024
+
+# Sessions shared by drivers with the same credentials and connection
+# settings (see PostHogDriver._create_session): key -> [session, holders]
+_SHARED_SESSIONS: Dict[Tuple, List[Any]] = {}
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+
+def _release_session(key: Tuple, session):
+    """Finalizer callback: drop one driver's hold on a shared session."""
+    with _SHARED_SESSIONS_LOCK:
+        entry = _SHARED_SESSIONS.get(key)
+        if entry is not None and entry[0] is session:
+            entry[1] -= 1
+            if entry[1]:
+                return
+            del _SHARED_SESSIONS[key]
+    try:
+        session.close()
+    except Exception:
+        pass
+
+
+def _body_excerpt(response, limit: int = 500) -> str:
+    """
+    First `limit` bytes of a response body as text, for error details.
+
+    Decodes only the slice (response.text would decode the whole body,
+    and guess its charset first when the server sends none).
+    """
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+# Response bodies that hold no records; _parse_page() skips decoding them
+_EMPTY_BODIES = frozenset((b"[]", b"{}"))
+
+# Envelope keys that may hold a response's records, in lookup order
+# (case-sensitive; see _extract_page)
+_RECORD_KEYS = ("results", "data", "items", "Results", "Data", "Items")
+
+# ijson prefixes of the records in an envelope array: PostHog's paginated
+# envelope ({"count", "next", "previous", "results": [...]}) and the other
+# _RECORD_KEYS wrappers _extract_page() accepts. A bare top-level array's
+# records have prefix "item" (see _stream_page).
+_STREAM_ITEM_PREFIXES = frozenset(f"{key}.item" for key in _RECORD_KEYS)
+
+# Capabilities never change, and DriverCapabilities is immutable, so every
+# driver shares one instance
+_CAPABILITIES = DriverCapabilities(
+    read=True,
+    write=True,
+    update=True,
+    delete=True,
+    batch_operations=True,
+    streaming=True,
+    pagination=PaginationStyle.CURSOR,
+    query_language=None,  # REST API, no query language
+    max_page_size=100,
+    supports_transactions=False,
+    supports_relationships=True,
+)
+
+# Common fields across most PostHog resources
+_COMMON_FIELDS = {
+    "id": {
+        "type": "string",
+        "label": "ID",
+        "required": False,
+        "nullable": False,
+        "description": "Unique identifier",
+    },
+    "created_at": {
+        "type": "datetime",
+        "label": "Created At",
+        "required": False,
+        "nullable": False,
+        "description": "Creation timestamp",
+    },
+    "updated_at": {
+        "type": "datetime",
+        "label": "Updated At",
+        "required": False,
+        "nullable": False,
+        "description": "Last update timestamp",
+    },
+}
+
+# Resource-specific fields, as raw dicts (see _FIELD_SPECS)
+_RESOURCE_FIELDS = {
+    "batch_exports": {
+        **_COMMON_FIELDS,
+        "name": {
+            "type": "string",
+            "label": "Name",
+            "required": True,
+            "nullable": False,
+            "max_length": 255,
+            "description": "Batch export name",
+        },
+        "destination": {
+            "type": "object",
+            "label": "Destination",
+            "required": True,
+            "nullable": False,
+            "description": "Export destination configuration",
+        },
+        "status": {
+            "type": "string",
+            "label": "Status",
+            "required": False,
+            "nullable": False,
+            "enum": ["running", "paused", "completed", "failed"],
+            "description": "Export status",
+        },
+    },
+    "dashboards": {
+        **_COMMON_FIELDS,
+        "name": {
+            "type": "string",
+            "label": "Name",
+            "required": True,
+            "nullable": False,
+            "max_length": 255,
+            "description": "Dashboard name",
+        },
+        "description": {
+            "type": "string",
+            "label": "Description",
+            "required": False,
+            "nullable": True,
+            "description": "Dashboard description",
+        },
+        "tiles": {
+            "type": "array",
+            "label": "Tiles",
+            "required": False,
+            "nullable": False,
+            "description": "Dashboard tiles/visualizations",
+        },
+    },
+    "datasets": {
+        **_COMMON_FIELDS,
+        "name": {
+            "type": "string",
+            "label": "Name",
+            "required": True,
+            "nullable": False,
+            "max_length": 255,
+            "description": "Dataset name",
+        },
+        "description": {
+            "type": "string",
+            "label": "Description",
+            "required": False,
+            "nullable": True,
+            "description": "Dataset description",
+        },
+    },
+    "dataset_items": {
+        **_COMMON_FIELDS,
+        "dataset_id": {
+            "type": "string",
+            "label": "Dataset ID",
+            "required": True,
+            "nullable": False,
+            "description": "Parent dataset ID",
+        },
+        "value": {
+            "type": "any",
+            "label": "Value",
+            "required": True,
+            "nullable": False,
+            "description": "Item value",
+        },
+    },
+    "persons": {
+        **_COMMON_FIELDS,
+        "properties": {
+            "type": "object",
+            "label": "Properties",
+            "required": False,
+            "nullable": True,
+            "description": "Person properties",
+        },
+    },
+    "events": {
+        **_COMMON_FIELDS,
+        "event": {
+            "type": "string",
+            "label": "Event",
+            "required": True,
+            "nullable": False,
+            "description": "Event name",
+        },
+        "properties": {
+            "type": "object",
+            "label": "Properties",
+            "required": False,
+            "nullable": True,
+            "description": "Event properties",
+        },
+    },
+    "feature_flags": {
+        **_COMMON_FIELDS,
+        "key": {
+            "type": "string",
+            "label": "Key",
+            "required": True,
+            "nullable": False,
+            "description": "Feature flag key",
+        },
+        "active": {
+            "type": "boolean",
+            "label": "Active",
+            "required": False,
+            "nullable": False,
+            "description": "Is feature flag active",
+        },
+    },
+    "desktop_recordings": {
+        **_COMMON_FIELDS,
+        "name": {
+            "type": "string",
+            "label": "Name",
+            "required": False,
+            "nullable": True,
+            "description": "Recording name",
+        },
+    },
+    "error_tracking": {
+        **_COMMON_FIELDS,
+        "fingerprint": {
+            "type": "string",
+            "label": "Fingerprint",
+            "required": True,
+            "nullable": False,
+            "description": "Error fingerprint",
+        },
+    },
+    "endpoints": {
+        **_COMMON_FIELDS,
+        "name": {
+            "type": "string",
+            "label": "Name",
+            "required": True,
+            "nullable": False,
+            "description": "Endpoint/materialized query name",
+        },
+        "query": {
+            "type": "object",
+            "label": "Query",
+            "required": True,
+            "nullable": False,
+            "description": "Query definition",
+        },
+    },
+}
+
+# get_fields() schemas, converted to FieldSpec once at import rather than
+# rebuilt on every call
+_FIELD_SPECS = {
+    object_name: {name: FieldSpec.from_dict(spec) for name, spec in schema.items()}
+    for object_name, schema in _RESOURCE_FIELDS.items()
+}
+_COMMON_FIELD_SPECS = {
+    name: FieldSpec.from_dict(spec) for name, spec in _COMMON_FIELDS.items()
+}
+
+
 class PostHogDriver(BaseDriver):
     """
     PostHog Python Driver
@@ -99,17 +484,18 @@ class PostHogDriver(BaseDriver):
         timeout: Request timeout in seconds
         max_retries: Number of retry attempts for rate limiting
         debug: Enable debug logging
+        pool_size: Keep-alive connections kept per host
 
     Example:
         >>> driver = PostHogDriver.from_env()
-        >>> dashboards = driver.read("SELECT id, name FROM dashboards")
+        >>> dashboards = driver.read("/dashboards")
         >>> for dashboard in dashboards:
         ...     print(dashboard['name'])
         >>> driver.close()
     """
 
     # Available objects/resources
-    OBJECTS = [
+    OBJECTS: Tuple[str, ...] = (
         "batch_exports",
         "dashboards",
         "datasets",
@@ -120,7 +506,13 @@ class PostHogDriver(BaseDriver):
         "persons",
         "events",
         "feature_flags",
-    ]
+    )
+    # For O(1) membership checks on every CRUD call
+    _OBJECTS_SET = frozenset(OBJECTS)
+
+    # (api_url, hash(api_key)) pairs that passed _validate_connection() in
+    # this process; later drivers with the same credentials skip the probe
+    _validated_keys: Set[Tuple[str, int]] = set()
 
     def __init__(
         self,
@@ -130,6 +522,10 @@ class PostHogDriver(BaseDriver):
         timeout: int = 30,
         max_retries: int = 3,
         debug: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        validate: bool = True,
+        http2: bool = False,
+        project_api_key: Optional[str] = None,
         **kwargs
     ):
         """
@@ -139,7 +535,7 @@ class PostHogDriver(BaseDriver):
         1. Phase 1: Custom attributes (project_id, logger)
         2. Phase 2: Parent attributes (api_url, api_key, etc.)
         3. Phase 3: Create session
-        4. Phase 4: Validate connection
+        4. Phase 4: Validate connection (deferred when validate=False)
 
         Args:
             api_url: PostHog API base URL
@@ -149,13 +545,26 @@ class PostHogDriver(BaseDriver):
             api_key: Personal API key for authentication
                 Can be loaded from POSTHOG_API_KEY environment variable
             project_id: PostHog project ID (optional, can be inferred from API)
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Request timeout in seconds (default: 30). Connecting
+                is capped at 5 seconds; the full timeout applies to reads
             max_retries: Retry attempts on rate limit (default: 3)
             debug: Enable debug logging (default: False)
+            pool_size: Keep-alive connections kept per host (default: 10).
+                Raise it when sharing one driver across many threads.
+            validate: Probe the API now (default: True). Pass False to skip
+                the roundtrip at construction; the probe then runs before
+                the first request.
+            http2: Send sync requests over HTTP/2 with httpx.Client instead
+                of requests (default: False). Needs
+                pip install posthog-driver[async]
+            project_api_key: Project API key ("phc_..."), used only by
+                batch_write("events", ...) to send events to the capture
+                endpoint
 
         Raises:
             AuthenticationError: If API key is invalid or missing
             ConnectionError: If cannot reach PostHog API
+            ImportError: If http2=True but httpx/h2 are not installed
 
         Example:
             >>> # Load from environment
@@ -171,14 +580,23 @@ class PostHogDriver(BaseDriver):
         # ===== PHASE 1: Set custom attributes =====
         self.project_id = project_id
         self.driver_name = "PostHogDriver"
+        self.http2 = http2
+        self.project_api_key = project_api_key
 
-        # Setup logging
+        # Setup logging: a debug driver gets its own child logger, so its
+        # DEBUG level never leaks to other drivers or overrides a level the
+        # application set on this module's logger (left untouched otherwise)
+        logger = logging.getLogger(__name__)
         if debug:
-            logging.basicConfig(level=logging.DEBUG)
-            logger = logging.getLogger(__name__)
-        else:
-            logger = logging.getLogger(__name__)
-            logger.setLevel(logging.WARNING)
+            logger = logger.getChild(str(id(self)))
+            logger.setLevel(logging.DEBUG)
+            if not logger.handlers:
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter("%(name)s %(levelname)s %(message)s"))
+                logger.addHandler(handler)
+                # The handler above prints the records; don't repeat them
+                # through handlers the application configured
+                logger.propagate = False
 
         self.logger = logger
 
@@ -190,14 +608,26 @@ class PostHogDriver(BaseDriver):
         self.timeout = timeout or 30
         self.max_retries = max_retries or 3
         self.debug = debug
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        # (connect, read): reused keep-alive connections make connects
+        # rare, so a slow one means a dead host - fail it fast
+        self._timeout = (min(DEFAULT_CONNECT_TIMEOUT, self.timeout), self.timeout)
+
+        # URL prefixes, built once so requests concatenate instead of
+        # calling urljoin() each time
+        self._base = self.api_url.rstrip("/") + "/"
+        self._env_segment = f"environments/{self.project_id or 'default'}"
+        self._env_prefix = f"{self._base}{self._env_segment}/"
 
         # ===== PHASE 3: Create session =====
         # Session creation can now use all attributes set above
         self.session = self._create_session()
+        self._register_finalizer()
 
         # ===== PHASE 4: Validate connection =====
         # Validation can now use self.session and other attributes
-        self._validate_connection()
+        if validate:
+            self._ensure_validated()
 
     @classmethod
     def from_env(cls, **kwargs) -> "PostHogDriver":
@@ -208,6 +638,8 @@ class PostHogDriver(BaseDriver):
             POSTHOG_API_KEY: Personal API key (required)
             POSTHOG_API_URL: API base URL (optional, default: https://app.posthog.com/api)
             POSTHOG_PROJECT_ID: Project ID (optional)
+            POSTHOG_PROJECT_API_KEY: Project API key for batch_write("events")
+                (optional)
 
         Args:
             **kwargs: Additional arguments passed to __init__
@@ -226,21 +658,35 @@ class PostHogDriver(BaseDriver):
             1. Set environment variable: export POSTHOG_API_KEY=your_api_key
             2. Create driver: driver = PostHogDriver.from_env()
         """
-        api_key = os.getenv("POSTHOG_API_KEY")
+        environ = os.environ
+        api_key = environ.get("POSTHOG_API_KEY")
         if not api_key:
             raise AuthenticationError(
                 "Missing PostHog API key. Set POSTHOG_API_KEY environment variable.",
-                details={
-                    "required_env_vars": ["POSTHOG_API_KEY"],
-                    "optional_env_vars": ["POSTHOG_API_URL", "POSTHOG_PROJECT_ID"],
-                    "suggestion": "export POSTHOG_API_KEY=your_personal_api_key",
-                },
+                details=dict(_FROM_ENV_ERROR_DETAILS),
             )
 
-        api_url = os.getenv("POSTHOG_API_URL", "https://app.posthog.com/api")
-        project_id = os.getenv("POSTHOG_PROJECT_ID")
+        kwargs.setdefault("project_api_key", environ.get("POSTHOG_PROJECT_API_KEY"))
+
+        return cls(
+            api_url=environ.get("POSTHOG_API_URL") or "https://app.posthog.com/api",
+            api_key=api_key,
+            project_id=environ.get("POSTHOG_PROJECT_ID"),
+            **kwargs,
+        )
+
+    @classmethod
+    def clear_validation_cache(cls):
+        """
+        Forget which credentials have been validated in this process.
 
-        return cls(api_url=api_url, api_key=api_key, project_id=project_id, **kwargs)
+        The next driver created (or first operation with validate=False)
+        probes the API again. Useful after rotating an API key, and in tests.
+
+        Example:
+            >>> PostHogDriver.clear_validation_cache()
+        """
+        PostHogDriver._validated_keys.clear()
 
     def get_capabilities(self) -> DriverCapabilities:
         """
@@ -260,19 +706,7 @@ class PostHogDriver(BaseDriver):
             >>> if caps.write:
             ...     print("Can create new resources")
         """
-        return DriverCapabilities(
-            read=True,
-            write=True,
-            update=True,
-            delete=True,
-            batch_operations=True,
-            streaming=True,
-            pagination=PaginationStyle.CURSOR,
-            query_language=None,  # REST API, no query language
-            max_page_size=100,
-            supports_transactions=False,
-            supports_relationships=True,
-        )
+        return _CAPABILITIES
 
     def list_objects(self) -> List[str]:
         """
@@ -290,9 +724,9 @@ class PostHogDriver(BaseDriver):
             datasets
             ...
         """
-        return self.OBJECTS
+        return list(self.OBJECTS)
 
-    def get_fields(self, object_name: str) -> Dict[str, Any]:
+    def get_fields(self, object_name: str) -> Dict[str, FieldSpec]:
         """
         Get field schema for a PostHog resource.
 
@@ -302,11 +736,14 @@ class PostHogDriver(BaseDriver):
         - Maximum length (for strings)
         - Human-readable label
 
+        The schemas are module-level constants converted to FieldSpec once
+        at import; each driver also caches its copy (see BaseDriver).
+
         Args:
             object_name: Name of the resource (e.g., "dashboards", "datasets")
 
         Returns:
-            Dictionary mapping field names to field metadata
+            Dictionary mapping field names to FieldSpec
 
         Raises:
             ObjectNotFoundError: If object_name is not recognized
@@ -314,10 +751,10 @@ class PostHogDriver(BaseDriver):
         Example:
             >>> fields = driver.get_fields("dashboards")
             >>> if "name" in fields:
-            ...     print(f"Name field type: {fields['name']['type']}")
-            {'type': 'string', 'required': True, ...}
+            ...     print(f"Name field type: {fields['name'].type}")
+            Name field type: string
         """
-        if object_name not in self.OBJECTS:
+        if object_name not in self._OBJECTS_SET:
             raise ObjectNotFoundError(
                 f"Object '{object_name}' not found in PostHog API",
                 details={
@@ -327,203 +764,8 @@ class PostHogDriver(BaseDriver):
                 },
             )
 
-        # Common fields across most PostHog resources
-        common_fields = {
-            "id": {
-                "type": "string",
-                "label": "ID",
-                "required": False,
-                "nullable": False,
-                "description": "Unique identifier",
-            },
-            "created_at": {
-                "type": "datetime",
-                "label": "Created At",
-                "required": False,
-                "nullable": False,
-                "description": "Creation timestamp",
-            },
-            "updated_at": {
-                "type": "datetime",
-                "label": "Updated At",
-                "required": False,
-                "nullable": False,
-                "description": "Last update timestamp",
-            },
-        }
-
-        # Resource-specific fields
-        resource_fields = {
-            "batch_exports": {
-                **common_fields,
-                "name": {
-                    "type": "string",
-                    "label": "Name",
-                    "required": True,
-                    "nullable": False,
-                    "max_length": 255,
-                    "description": "Batch export name",
-                },
-                "destination": {
-                    "type": "object",
-                    "label": "Destination",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Export destination configuration",
-                },
-                "status": {
-                    "type": "string",
-                    "label": "Status",
-                    "required": False,
-                    "nullable": False,
-                    "enum": ["running", "paused", "completed", "failed"],
-                    "description": "Export status",
-                },
-            },
-            "dashboards": {
-                **common_fields,
-                "name": {
-                    "type": "string",
-                    "label": "Name",
-                    "required": True,
-                    "nullable": False,
-                    "max_length": 255,
-                    "description": "Dashboard name",
-                },
-                "description": {
-                    "type": "string",
-                    "label": "Description",
-                    "required": False,
-                    "nullable": True,
-                    "description": "Dashboard description",
-                },
-                "tiles": {
-                    "type": "array",
-                    "label": "Tiles",
-                    "required": False,
-                    "nullable": False,
-                    "description": "Dashboard tiles/visualizations",
-                },
-            },
-            "datasets": {
-                **common_fields,
-                "name": {
-                    "type": "string",
-                    "label": "Name",
-                    "required": True,
-                    "nullable": False,
-                    "max_length": 255,
-                    "description": "Dataset name",
-                },
-                "description": {
-                    "type": "string",
-                    "label": "Description",
-                    "required": False,
-                    "nullable": True,
-                    "description": "Dataset description",
-                },
-            },
-            "dataset_items": {
-                **common_fields,
-                "dataset_id": {
-                    "type": "string",
-                    "label": "Dataset ID",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Parent dataset ID",
-                },
-                "value": {
-                    "type": "any",
-                    "label": "Value",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Item value",
-                },
-            },
-            "persons": {
-                **common_fields,
-                "properties": {
-                    "type": "object",
-                    "label": "Properties",
-                    "required": False,
-                    "nullable": True,
-                    "description": "Person properties",
-                },
-            },
-            "events": {
-                **common_fields,
-                "event": {
-                    "type": "string",
-                    "label": "Event",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Event name",
-                },
-                "properties": {
-                    "type": "object",
-                    "label": "Properties",
-                    "required": False,
-                    "nullable": True,
-                    "description": "Event properties",
-                },
-            },
-            "feature_flags": {
-                **common_fields,
-                "key": {
-                    "type": "string",
-                    "label": "Key",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Feature flag key",
-                },
-                "active": {
-                    "type": "boolean",
-                    "label": "Active",
-                    "required": False,
-                    "nullable": False,
-                    "description": "Is feature flag active",
-                },
-            },
-            "desktop_recordings": {
-                **common_fields,
-                "name": {
-                    "type": "string",
-                    "label": "Name",
-                    "required": False,
-                    "nullable": True,
-                    "description": "Recording name",
-                },
-            },
-            "error_tracking": {
-                **common_fields,
-                "fingerprint": {
-                    "type": "string",
-                    "label": "Fingerprint",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Error fingerprint",
-                },
-            },
-            "endpoints": {
-                **common_fields,
-                "name": {
-                    "type": "string",
-                    "label": "Name",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Endpoint/materialized query name",
-                },
-                "query": {
-                    "type": "object",
-                    "label": "Query",
-                    "required": True,
-                    "nullable": False,
-                    "description": "Query definition",
-                },
-            },
-        }
-
-        return resource_fields.get(object_name, common_fields)
+        # FieldSpec is immutable, so only the mapping needs copying
+        return dict(_FIELD_SPECS.get(object_name, _COMMON_FIELD_SPECS))
 
     def read(
         self,
@@ -541,13 +783,15 @@ class PostHogDriver(BaseDriver):
             query: Endpoint path or resource selector (e.g., "/dashboards", "/datasets")
                    Can also use full endpoint like "/environments/{project_id}/dashboards/"
             limit: Maximum records to return (max: 100)
-            offset: Number of records to skip (for pagination)
+            offset: Number of records to skip (for pagination). Deep
+                offsets are slow server-side; page with read_batched()
 
         Returns:
             List of records
 
         Raises:
-            QuerySyntaxError: If endpoint is invalid
+            QuerySyntaxError: If query is not an endpoint path (checked locally,
+                before any request) or the endpoint is invalid
             RateLimitError: If rate limit exceeded
             ObjectNotFoundError: If resource not found
 
@@ -562,6 +806,9 @@ class PostHogDriver(BaseDriver):
             >>> for dashboard in dashboards:
             ...     print(dashboard['name'])
         """
+        self._validate_query(query)
+        self._ensure_validated()
+
         if limit and limit > 100:
             raise ValidationError(
                 f"limit cannot exceed 100 (got: {limit})",
@@ -576,25 +823,82 @@ class PostHogDriver(BaseDriver):
         if limit is None:
             limit = 50  # Safe default
 
-        # Build request URL
+        endpoint, url = self._list_url(query)
+
+        # Build query parameters; offset=0 is left out so the server takes
+        # its plain first-page path
+        params = {"limit": limit}
+        if offset:
+            params["offset"] = offset
+            if offset >= _DEEP_OFFSET and not self.__dict__.get("_deep_offset_warned"):
+                self._deep_offset_warned = True
+                self.logger.warning(
+                    f"read() with offset={offset}: the server scans past every "
+                    f"skipped record. Use read_batched() or iter_read(), which "
+                    f"follow PostHog's next links, to page through large results."
+                )
+
+        # Identical concurrent reads share a single request
+        return self._coalesce(
+            ("read", url, limit, offset or 0), self._get_records, url, endpoint, params
+        )
+
+    def _list_url(self, query: str) -> Tuple[str, str]:
+        """
+        Resolve a read() query to its endpoint path and full URL.
+
+        Returns:
+            (endpoint, url) - endpoint is used in error messages
+        """
         endpoint = query.lstrip("/")
         if not endpoint.startswith("environments/"):
             # Auto-inject project_id if needed
-            if self.project_id:
-                endpoint = f"environments/{self.project_id}/{endpoint}"
-            else:
-                endpoint = f"environments/default/{endpoint}"
+            endpoint = f"{self._env_segment}/{endpoint}"
 
-        url = urljoin(self.api_url, endpoint)
+        return endpoint, self._base + endpoint
 
-        # Build query parameters
-        params = {"limit": limit}
-        if offset is not None:
-            params["offset"] = offset
+    def _get_records(
+        self, url: str, endpoint: str, params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """GET a list endpoint and return its records (used by read())."""
+        return self._get_page(url, endpoint, params)[0]
 
+    def _get_page(
+        self, url: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        GET a list endpoint and parse one page.
+
+        Returns:
+            (records, next_url) - next_url is None on the last page
+
+        Raises:
+            TimeoutError, ConnectionError, AuthenticationError,
+            ObjectNotFoundError, RateLimitError, QuerySyntaxError
+        """
+        return self._parse_page(self._send_get(url, endpoint, params))
+
+    def _send_get(
+        self,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        stream: bool = False,
+    ):
+        """
+        GET a list endpoint, mapping failures to driver exceptions.
+
+        With stream=True the body is left unread on the socket (requests
+        session only) for iter_read() to parse incrementally.
+
+        Raises:
+            TimeoutError, ConnectionError, AuthenticationError,
+            ObjectNotFoundError, RateLimitError, QuerySyntaxError
+        """
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+            response = self._request_with_retry(
+                "GET", url, params=params, stream=stream
+            )
         except requests.exceptions.Timeout:
             raise TimeoutError(
                 f"Request to {endpoint} timed out after {self.timeout} seconds",
@@ -613,52 +917,99 @@ class PostHogDriver(BaseDriver):
                     "suggestion": "Check your internet connection or api_url",
                 },
             )
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Invalid PostHog API key. Check your credentials.",
-                    details={
-                        "status_code": 401,
-                        "api_url": self.api_url,
-                        "suggestion": "Verify POSTHOG_API_KEY is correct",
-                    },
-                )
-            elif response.status_code == 404:
-                raise ObjectNotFoundError(
-                    f"Resource '{endpoint}' not found",
-                    details={
-                        "endpoint": endpoint,
-                        "available": self.OBJECTS,
-                        "suggestion": "Use list_objects() to see available resources",
-                    },
-                )
-            elif response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                raise RateLimitError(
-                    f"PostHog API rate limit exceeded. Retry after {retry_after} seconds.",
-                    details={
-                        "retry_after": retry_after,
-                        "suggestion": "Wait and retry, or reduce request frequency",
-                    },
-                )
-            raise QuerySyntaxError(
-                f"Query error: {response.status_code} {response.reason}",
+
+        if response.status_code >= 400:
+            try:
+                self._check_response(response, endpoint)
+            finally:
+                response.close()
+        return response
+
+    def _check_response(
+        self,
+        response,
+        endpoint: str,
+        object_name: Optional[str] = None,
+        record_id: Optional[str] = None,
+    ):
+        """
+        Raise the driver exception for a failed response; no-op on success.
+
+        Dispatches on the status code directly rather than going through
+        raise_for_status() and catching HTTPError, so the success path
+        costs one comparison; common statuses are looked up in
+        _ERROR_HANDLERS. Works with both requests and httpx responses.
+
+        Args:
+            response: HTTP response
+            endpoint: Endpoint path, for error messages
+            object_name: Resource type, for create/update/delete/lookups
+            record_id: Resource ID, for single-record calls
+
+        Raises:
+            ValidationError: On 400 from a write
+            AuthenticationError: On 401
+            ObjectNotFoundError: On 404
+            RateLimitError: On 429 (after retries)
+            QuerySyntaxError: On other errors from list endpoints
+            requests.exceptions.HTTPError: On other errors from writes
+        """
+        status = response.status_code
+        if status < 400:
+            return
+
+        if status == 400 and object_name is not None:
+            try:
+                error_msg = _json_loads(response.content).get("detail", "Invalid request")
+            except (ValueError, AttributeError):
+                error_msg = "Invalid request"
+            raise ValidationError(
+                f"Validation failed: {error_msg}",
                 details={
-                    "status_code": response.status_code,
-                    "error": response.text[:500],
-                    "endpoint": endpoint,
+                    "object": object_name,
+                    "status_code": 400,
+                    "error": error_msg,
+                },
+            )
+        elif status == 404 and record_id is not None:
+            raise ObjectNotFoundError(
+                f"Resource '{object_name}/{record_id}' not found",
+                details={
+                    "object": object_name,
+                    "record_id": record_id,
+                    "status_code": 404,
                 },
             )
 
-        # Parse response
-        return self._parse_response(response)
+        handler = _ERROR_HANDLERS.get(status)
+        if handler is not None:
+            raise handler(self, response, endpoint)
+
+        if object_name is not None:
+            # Unmapped write errors keep surfacing as requests' HTTPError
+            _check_status(response)
+
+        # requests calls it reason, httpx reason_phrase
+        reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+        raise QuerySyntaxError(
+            f"Query error: {status} {reason}",
+            details={
+                "status_code": status,
+                "error": _body_excerpt(response),
+                "endpoint": endpoint,
+            },
+        )
 
     def read_batched(
-        self, query: str, batch_size: int = 1000
+        self, query: str, batch_size: int = 100
     ) -> Iterator[List[Dict[str, Any]]]:
         """
         Execute query and yield results in batches (memory-efficient).
 
+        Groups the records from iter_read() into lists of batch_size, so
+        pages are parsed incrementally (with ijson installed) and every
+        page costs the same no matter how deep the iteration goes.
+
         Args:
             query: Endpoint path (e.g., "/dashboards")
             batch_size: Records per batch (max: 100)
@@ -674,6 +1025,246 @@ class PostHogDriver(BaseDriver):
             ...     process_batch(batch)
             ...     print(f"Processed {len(batch)} records")
         """
+        self._check_batch_size(batch_size)
+
+        batch = []
+        for record in self.iter_read(query, page_size=batch_size):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def iter_read(self, query: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Execute query and yield records one at a time, across all pages.
+
+        Follows the "next" URL PostHog returns with each page (unlike a
+        growing offset, which the server has to skip past each time).
+        With ijson installed (pip install posthog-driver[streaming]) large
+        pages are parsed straight from the socket, so only the current
+        record is held in memory rather than the decoded page; small pages
+        (and every page without ijson) are decoded in one go.
+
+        Args:
+            query: Endpoint path (e.g., "/persons")
+            page_size: Records requested per page (max: 100)
+
+        Yields:
+            Records as dictionaries
+
+        Raises:
+            ValidationError: If page_size exceeds API limit
+            QuerySyntaxError: If query is not an endpoint path
+
+        Example:
+            >>> for person in driver.iter_read("/persons"):
+            ...     process(person)
+        """
+        self._check_batch_size(page_size)
+        self._validate_query(query)
+        self._ensure_validated()
+
+        endpoint, url = self._list_url(query)
+        params = {"limit": page_size}
+        streaming = ijson is not None and isinstance(self.session, requests.Session)
+
+        while url is not None:
+            response = self._send_get(url, endpoint, params, stream=streaming)
+            try:
+                if streaming and self._worth_streaming(response):
+                    url = yield from self._stream_page(response)
+                else:
+                    records, url = self._parse_page(response)
+                    yield from records
+            finally:
+                response.close()
+            # "next" already carries the limit and position
+            params = None
+
+    @staticmethod
+    def _worth_streaming(response: requests.Response) -> bool:
+        """
+        Whether a page is large enough to parse incrementally.
+
+        Below _STREAM_MIN_BYTES the page is read whole and decoded with
+        _json_loads (orjson when installed), which beats ijson's
+        per-event overhead. A missing Content-Length (chunked transfer)
+        counts as large.
+        """
+        length = response.headers.get("Content-Length")
+        return not (length and length.isdigit() and int(length) < _STREAM_MIN_BYTES)
+
+    def _stream_page(self, response: requests.Response):
+        """
+        Yield a page's records while it is parsed from the socket.
+
+        Records are built with ijson from a bare top-level array, or from
+        the first envelope key in the body (one of _RECORD_KEYS) that holds
+        records; other envelopes are skipped, and empty ones fall through,
+        as in _extract_page(). The "next" URL is captured on the way past.
+
+        Returns:
+            The next page's URL (the generator's return value), or None
+        """
+        response.raw.decode_content = True
+        next_url = None
+        builder = None
+        records = None  # prefix of the records once an envelope is chosen
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == records and event in ("end_map", "end_array"):
+                    if records in _RECORD_KEYS and not builder.value:
+                        records = None  # empty single-object envelope
+                    else:
+                        yield builder.value
+                    builder = None
+                continue
+
+            if records is None:
+                if prefix == "" and event == "start_array":
+                    records = "item"
+                    continue
+                if prefix in _STREAM_ITEM_PREFIXES or (
+                    # Single object, wrapped in a list by _extract_page()
+                    prefix in _RECORD_KEYS and event == "start_map"
+                ):
+                    records = prefix
+
+            if prefix == records:
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    yield value
+            elif prefix == "next" and event == "string":
+                next_url = value or None
+        return next_url
+
+    async def aread_batched(
+        self,
+        query: str,
+        batch_size: int = 100,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async version of read_batched() that fetches pages in parallel.
+
+        The first page reports the total "count", so the remaining pages
+        are requested by offset, up to concurrency at a time, over the
+        shared httpx.AsyncClient. Batches are yielded as they arrive, which
+        is not necessarily in order. Endpoints without a count (e.g.
+        cursor-paginated events) follow "next" one page at a time.
+
+        Without httpx installed, falls back to BaseDriver.aread_batched().
+
+        Args:
+            query: Endpoint path (e.g., "/persons")
+            batch_size: Records per batch (max: 100)
+            concurrency: Pages in flight at once (default: 8)
+
+        Yields:
+            Batches of records as lists of dictionaries
+
+        Example:
+            >>> async for batch in driver.aread_batched("/persons"):
+            ...     process_batch(batch)
+            >>> await driver.aclose()
+        """
+        self._check_batch_size(batch_size)
+
+        if httpx is None:
+            async for batch in super().aread_batched(query, batch_size, concurrency):
+                yield batch
+            return
+
+        self._validate_query(query)
+        if not self.__dict__.get("_validated"):
+            await self._run_sync(self._ensure_validated)
+
+        endpoint, url = self._list_url(query)
+        data = await self._aget_json(url, endpoint, {"limit": batch_size})
+        records, next_url = self._extract_page(data)
+        yield records
+
+        count = data.get("count") if isinstance(data, dict) else None
+        if not isinstance(count, int) or next_url is None:
+            # No total to plan with: follow "next" sequentially
+            while next_url is not None:
+                data = await self._aget_json(next_url, endpoint, None)
+                records, next_url = self._extract_page(data)
+                yield records
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset):
+            async with semaphore:
+                data = await self._aget_json(
+                    url, endpoint, {"limit": batch_size, "offset": offset}
+                )
+            return self._extract_page(data)[0]
+
+        pages = [
+            asyncio.ensure_future(fetch(offset))
+            for offset in range(batch_size, count, batch_size)
+        ]
+        try:
+            for page in asyncio.as_completed(pages):
+                yield await page
+        finally:
+            for page in pages:
+                page.cancel()
+
+    async def _aget_json(
+        self, url: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Any:
+        """
+        GET a list endpoint over httpx and decode it (used by aread_batched()).
+
+        Raises:
+            TimeoutError, ConnectionError, AuthenticationError,
+            ObjectNotFoundError, RateLimitError, QuerySyntaxError
+        """
+        try:
+            response = await self._arequest_with_retry("GET", url, params=params)
+        except httpx.HTTPError as e:
+            raise self._httpx_error(e, endpoint)
+
+        self._check_response(response, endpoint)
+        return self._decode(response)
+
+    def _httpx_error(self, error: Exception, endpoint: str) -> Exception:
+        """
+        Map an httpx transport failure to the driver exception for it.
+
+        Returns:
+            TimeoutError or ConnectionError; any other error unchanged
+        """
+        if isinstance(error, httpx.TimeoutException):
+            return TimeoutError(
+                f"Request to {endpoint} timed out after {self.timeout} seconds",
+                details={
+                    "timeout": self.timeout,
+                    "endpoint": endpoint,
+                    "suggestion": "Try increasing timeout or reducing query scope",
+                },
+            )
+        if isinstance(error, httpx.TransportError):
+            return ConnectionError(
+                f"Cannot reach PostHog API at {self.api_url}",
+                details={
+                    "api_url": self.api_url,
+                    "error": str(error),
+                    "suggestion": "Check your internet connection or api_url",
+                },
+            )
+        return error
+
+    def _check_batch_size(self, batch_size: int):
+        """Reject page sizes above the API maximum (100)."""
         if batch_size > 100:
             raise ValidationError(
                 f"batch_size cannot exceed 100 (got: {batch_size})",
@@ -684,15 +1275,6 @@ class PostHogDriver(BaseDriver):
                 },
             )
 
-        offset = 0
-        while True:
-            batch = self.read(query, limit=batch_size, offset=offset)
-            if not batch:
-                break
-
-            yield batch
-            offset += batch_size
-
     def create(self, object_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new resource.
@@ -716,7 +1298,9 @@ class PostHogDriver(BaseDriver):
             ... })
             >>> print(dashboard['id'])
         """
-        if object_name not in self.OBJECTS:
+        self._ensure_validated()
+
+        if object_name not in self._OBJECTS_SET:
             raise ObjectNotFoundError(
                 f"Object type '{object_name}' not found",
                 details={
@@ -725,36 +1309,14 @@ class PostHogDriver(BaseDriver):
                 },
             )
 
-        # Build endpoint URL
-        if self.project_id:
-            endpoint = f"environments/{self.project_id}/{object_name}/"
-        else:
-            endpoint = f"environments/default/{object_name}/"
-
-        url = urljoin(self.api_url, endpoint)
+        url = self._object_url(object_name)
 
-        try:
-            response = self.session.post(url, json=data, timeout=self.timeout)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 400:
-                error_msg = response.json().get("detail", "Invalid request")
-                raise ValidationError(
-                    f"Validation failed: {error_msg}",
-                    details={
-                        "object": object_name,
-                        "status_code": 400,
-                        "error": error_msg,
-                    },
-                )
-            elif response.status_code == 401:
-                raise AuthenticationError(
-                    "Invalid PostHog API key",
-                    details={"status_code": 401},
-                )
-            raise
+        response = self._request_with_retry(
+            "POST", url, data=_json_dumps(data), headers=_JSON_HEADERS
+        )
+        self._check_response(response, object_name, object_name)
 
-        return response.json()
+        return _json_loads(response.content)
 
     def update(
         self, object_name: str, record_id: str, data: Dict[str, Any]
@@ -779,36 +1341,22 @@ class PostHogDriver(BaseDriver):
             ...     "name": "Updated Name"
             ... })
         """
-        if object_name not in self.OBJECTS:
+        self._ensure_validated()
+
+        if object_name not in self._OBJECTS_SET:
             raise ObjectNotFoundError(
                 f"Object type '{object_name}' not found",
                 details={"requested": object_name, "available": self.OBJECTS},
             )
 
-        # Build endpoint URL
-        if self.project_id:
-            endpoint = f"environments/{self.project_id}/{object_name}/{record_id}/"
-        else:
-            endpoint = f"environments/default/{object_name}/{record_id}/"
-
-        url = urljoin(self.api_url, endpoint)
+        url = self._object_url(object_name, record_id)
 
-        try:
-            response = self.session.patch(url, json=data, timeout=self.timeout)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                raise ObjectNotFoundError(
-                    f"Resource '{object_name}/{record_id}' not found",
-                    details={
-                        "object": object_name,
-                        "record_id": record_id,
-                        "status_code": 404,
-                    },
-                )
-            raise
+        response = self._request_with_retry(
+            "PATCH", url, data=_json_dumps(data), headers=_JSON_HEADERS
+        )
+        self._check_response(response, object_name, object_name, record_id)
 
-        return response.json()
+        return _json_loads(response.content)
 
     def delete(self, object_name: str, record_id: str) -> bool:
         """
@@ -830,35 +1378,81 @@ class PostHogDriver(BaseDriver):
             >>> success = driver.delete("dashboards", "123")
             >>> print(f"Deleted: {success}")
         """
-        if object_name not in self.OBJECTS:
+        self._ensure_validated()
+
+        if object_name not in self._OBJECTS_SET:
             raise ObjectNotFoundError(
                 f"Object type '{object_name}' not found",
                 details={"requested": object_name, "available": self.OBJECTS},
             )
 
-        # Build endpoint URL
-        if self.project_id:
-            endpoint = f"environments/{self.project_id}/{object_name}/{record_id}/"
-        else:
-            endpoint = f"environments/default/{object_name}/{record_id}/"
+        url = self._object_url(object_name, record_id)
 
-        url = urljoin(self.api_url, endpoint)
+        response = self._request_with_retry("DELETE", url)
+        self._check_response(response, object_name, object_name, record_id)
+        return True
 
-        try:
-            response = self.session.delete(url, timeout=self.timeout)
-            response.raise_for_status()
-            return True
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                raise ObjectNotFoundError(
-                    f"Resource '{object_name}/{record_id}' not found",
-                    details={
-                        "object": object_name,
-                        "record_id": record_id,
-                        "status_code": 404,
-                    },
-                )
-            raise
+    def batch_write(
+        self,
+        object_name: str,
+        records: List[Dict[str, Any]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many resources.
+
+        Events are sent in a single request to PostHog's batch capture
+        endpoint (needs project_api_key); the events API itself is
+        read-only. Other resources are created concurrently over the
+        pooled session (see BaseDriver.batch_write()).
+
+        Args:
+            object_name: Resource type (e.g., "events", "dashboards")
+            records: Resource data for each record. Events need "event"
+                and "distinct_id"
+            max_concurrency: Maximum requests in flight (default: 10,
+                capped at pool_size; unused for events)
+
+        Returns:
+            Created resources in the same order as records. For events,
+            the records as sent (capture returns no per-event data)
+
+        Raises:
+            ValidationError: If a record is invalid, or events are sent
+                without project_api_key
+            ObjectNotFoundError: If resource type not found
+
+        Example:
+            >>> driver.batch_write("events", [
+            ...     {"event": "signed_up", "distinct_id": "user-1"},
+            ...     {"event": "signed_up", "distinct_id": "user-2"},
+            ... ])
+        """
+        if object_name != "events":
+            return super().batch_write(object_name, records, max_concurrency)
+        if not records:
+            return []
+
+        if not self.project_api_key:
+            raise ValidationError(
+                "Sending events requires a project API key",
+                details={
+                    "object": object_name,
+                    "suggestion": "Pass project_api_key= or set POSTHOG_PROJECT_API_KEY",
+                },
+            )
+
+        # Capture lives on the host root, not under /api
+        host = self._base[: -len("api/")] if self._base.endswith("/api/") else self._base
+        url = host + "batch/"
+        body = {"api_key": self.project_api_key, "batch": list(records)}
+
+        response = self._request_with_retry(
+            "POST", url, data=_json_dumps(body), headers=_JSON_HEADERS
+        )
+        self._check_response(response, object_name, object_name)
+
+        return body["batch"]
 
     def call_endpoint(
         self,
@@ -888,35 +1482,56 @@ class PostHogDriver(BaseDriver):
             ...     params={"limit": 50}
             ... )
         """
-        url = urljoin(self.api_url, endpoint.lstrip("/"))
-
-        response = self.session.request(
-            method, url, params=params, json=data, timeout=self.timeout, **kwargs
+        # Shared implementation: pooled session, orjson when installed
+        return super().call_endpoint(
+            endpoint, method=method, params=params, data=data, **kwargs
         )
-        response.raise_for_status()
 
-        return response.json()
+    async def acall_endpoint(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async version of call_endpoint().
+
+        HTTP errors raise requests' HTTPError, as in call_endpoint();
+        timeouts and transport failures raise TimeoutError/ConnectionError.
 
-    def get_rate_limit_status(self) -> Dict[str, Any]:
+        Example:
+            >>> result = await driver.acall_endpoint("/dashboards")
+        """
+        if httpx is None:
+            # Thread-pool fallback: call_endpoint() raises requests' errors
+            return await super().acall_endpoint(
+                endpoint, method=method, params=params, data=data, **kwargs
+            )
+        try:
+            return await super().acall_endpoint(
+                endpoint, method=method, params=params, data=data, **kwargs
+            )
+        except httpx.HTTPError as e:
+            raise self._httpx_error(e, endpoint)
+
+    def get_rate_limit_status(self) -> RateLimit:
         """
         Get current rate limit status (if available in response headers).
 
         Returns:
-            Dictionary with rate limit information (when available)
+            RateLimit with rate limit information (fields are None when
+            not available)
 
         Example:
             >>> status = driver.get_rate_limit_status()
-            >>> if status.get("remaining"):
-            ...     print(f"Requests remaining: {status['remaining']}")
+            >>> if status.remaining:
+            ...     print(f"Requests remaining: {status.remaining}")
         """
         # PostHog doesn't provide rate limit headers in all responses
         # This is a placeholder for when headers are available
-        return {
-            "remaining": None,
-            "limit": None,
-            "reset_at": None,
-            "retry_after": None,
-        }
+        return EMPTY_RATE_LIMIT
 
     def close(self):
         """
@@ -929,22 +1544,76 @@ class PostHogDriver(BaseDriver):
             ... finally:
             ...     driver.close()
         """
-        if self.session:
-            self.session.close()
+        had_session = self.session is not None
+
+        # Release the shared session (closed once no driver holds it), then
+        # let the base class drop memoized discovery results
+        finalizer = self.__dict__.pop("_finalizer", None)
+        if finalizer is not None:
+            finalizer()
+            self.session = None
+        super().close()
+
+        if had_session:
             self.logger.debug("PostHog driver session closed")
 
     # ===== PRIVATE HELPER METHODS =====
 
     def _create_session(self) -> requests.Session:
+        """
+        Return the pooled session for this driver's credentials and settings.
+
+        Drivers with the same api_url, api_key, max_retries, pool_size and
+        http2 share one session (built by _build_session()), so keep-alive
+        connections and TLS sessions outlive any single driver. The session
+        is closed when the last driver holding it is closed or collected.
+        """
+        key = (
+            self.api_url,
+            hash(self.api_key),
+            self.max_retries,
+            self.pool_size,
+            getattr(self, "http2", False),
+        )
+        self._session_key = key
+
+        with _SHARED_SESSIONS_LOCK:
+            entry = _SHARED_SESSIONS.get(key)
+            if entry is not None:
+                entry[1] += 1
+                return entry[0]
+            session = self._build_session()
+            _SHARED_SESSIONS[key] = [session, 1]
+            return session
+
+    def _register_finalizer(self):
+        """
+        Release this driver's hold on its shared session when collected.
+
+        See _create_session(); close() runs the finalizer early.
+        """
+        session = getattr(self, "session", None)
+        if session is not None:
+            self._finalizer = weakref.finalize(
+                self, _release_session, self._session_key, session
+            )
+
+    def _build_session(self) -> requests.Session:
         """
         Create HTTP session with authentication and retry strategy.
 
+        With http2=True this is an httpx.Client instead (see
+        _create_http2_session()).
+
         BUG PREVENTION #1 & #2: Authentication headers
 
         - Uses EXACT header name: Authorization
         - Bearer token format for Personal API Key
         - Does NOT set Content-Type in headers (handled by requests)
-        - Configures automatic retry on rate limits
+        - Negotiates compressed responses (br when brotli is installed)
+        - Retries connection errors (rate limits: _request_with_retry)
+        - Pools keep-alive connections (pool_size per host) so requests
+          skip the TCP+TLS handshake
 
         Returns:
             Configured requests.Session
@@ -952,36 +1621,86 @@ class PostHogDriver(BaseDriver):
         NOTE: This method is called during Phase 3 of initialization,
         after parent attributes are set but before validation.
         """
-        session = requests.Session()
-
         # Set headers that apply to ALL requests
-        session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": f"{self.driver_name}-Python-Driver/1.0.0",
-            }
-        )
+        headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "User-Agent": f"{self.driver_name}-Python-Driver/1.0.0",
+        }
         # NOTE: Do NOT set Content-Type here! (requests library handles it)
 
         # Add authentication (use IF, not ELIF - multiple can coexist)
         if self.api_key:
             # BUG PREVENTION #1: EXACT header name "Authorization"
-            session.headers["Authorization"] = f"Bearer {self.api_key}"
-
-        # Configure retry strategy for rate limits
-        if self.max_retries > 0:
-            retry_strategy = Retry(
-                total=self.max_retries,
-                backoff_factor=1,  # Exponential backoff: 1s, 2s, 4s, 8s
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        if getattr(self, "http2", False):
+            return self._create_http2_session(headers)
+
+        session = requests.Session()
+        session.headers.update(headers)
+
+        # Retry connection/read errors here, with jittered backoff; rate
+        # limits and 5xx are retried with decorrelated jitter by
+        # _request_with_retry()
+        retry_strategy = JitteredRetry(
+            total=self.max_retries,
+            backoff_factor=RETRY_BASE_DELAY,  # ~0.1s, 0.2s, 0.4s, ...
+            allowed_methods=RETRY_METHODS,
+        )
+
+        # Mount the pooled adapter even with retries disabled, so
+        # connections are always reused
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry_strategy,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if self.debug:
+            self.logger.debug(
+                f"Session created with retry strategy: {retry_strategy}, "
+                f"pool size: {self.pool_size}"
+            )
+
+        return session
+
+    def _create_http2_session(self, headers: Dict[str, str]):
+        """
+        Create an httpx.Client that speaks HTTP/2 (used when http2=True).
+
+        Concurrent requests (batch_read(), batch_write(), threads sharing
+        the driver) are multiplexed over one connection per host instead
+        of each holding its own. Connection errors are retried by the
+        transport, like the urllib3 Retry on the requests session.
+
+        Raises:
+            ImportError: If httpx or h2 is not installed
+        """
+        if httpx is None or not _HTTP2_AVAILABLE:
+            raise ImportError(
+                "http2=True requires httpx with HTTP/2 support. "
+                "Install with: pip install posthog-driver[async]"
             )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
+
+        connect, read = self._timeout
+        session = httpx.Client(
+            headers=headers,
+            timeout=httpx.Timeout(read, connect=connect),
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=self.max_retries,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            ),
+        )
 
         if self.debug:
-            self.logger.debug(f"Session created with retry strategy: {retry_strategy}")
+            self.logger.debug(f"HTTP/2 session created, pool size: {self.pool_size}")
 
         return session
 
@@ -989,69 +1708,158 @@ class PostHogDriver(BaseDriver):
         """
         Parse API response and extract data records.
 
+        See _parse_page(); this drops the "next" URL.
+        """
+        return self._parse_page(response)[0]
+
+    def _parse_page(
+        self, response: requests.Response
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Parse API response and extract data records and the next-page URL.
+
         BUG PREVENTION #3: Response parsing
 
         Handles different response formats:
         - Direct arrays: [{"id": 1}, {"id": 2}]
         - Wrapped objects: {"results": [...], "count": 100}
         - Alternative field names: "data", "items"
+        - Paginated envelopes: {"count", "next", "previous", "results"}
 
         Args:
             response: HTTP response from API
 
         Returns:
-            List of records
+            (records, next_url) - next_url is None when there is no next page
+
+        Raises:
+            ConnectionError: If response is not valid JSON
+        """
+        # No records to decode: 204, empty body, or an empty array/object
+        content = response.content
+        if response.status_code == 204 or not content or content in _EMPTY_BODIES:
+            return [], None
+        return self._extract_page(self._decode(response))
+
+    def _decode(self, response) -> Any:
+        """
+        Decode a JSON response body (requests or httpx).
 
         Raises:
             ConnectionError: If response is not valid JSON
         """
         try:
-            data = response.json()
+            return _json_loads(response.content)
         except ValueError as e:
             raise ConnectionError(
                 f"Invalid JSON response from PostHog API",
                 details={
                     "status_code": response.status_code,
-                    "content": response.text[:500],
+                    "content": _body_excerpt(response),
                     "error": str(e),
                 },
             )
 
-        # Handle direct array responses
-        if isinstance(data, list):
+    def _extract_page(
+        self, data: Any
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Extract (records, next_url) from a decoded response body.
+
+        See _parse_page() for the response formats handled.
+        """
+        # Handle direct array responses (exact type check: json decoders
+        # only ever produce plain lists)
+        if type(data) is list:
             if self.debug:
                 self.logger.debug(f"Parsed array response with {len(data)} records")
-            return data
+            return data, None
 
         # Handle object-wrapped responses
         if isinstance(data, dict):
             # BUG PREVENTION #3: Try all known field names (case-sensitive!)
-            # Primary field first, then common alternatives
-            records = (
-                data.get("results")
-                or data.get("data")
-                or data.get("items")
-                or data.get("Results")
-                or data.get("Data")
-                or data.get("Items")
-                or []
-            )
+            # Primary field first, then common alternatives; empty values
+            # fall through to the next key
+            records = next((data[key] for key in _RECORD_KEYS if data.get(key)), None)
+
+            next_url = data.get("next") or None
 
             # Ensure we return a list
-            if isinstance(records, list):
+            if type(records) is list:
                 if self.debug:
                     self.logger.debug(f"Parsed wrapped response with {len(records)} records")
-                return records
-            elif records is not None:
+                return records, next_url
+            elif records:
                 # Single object, wrap in list
-                return [records]
+                return [records], next_url
             else:
-                return []
+                return [], next_url
 
         # Unknown format
         if self.debug:
             self.logger.debug(f"Unknown response format: {type(data)}")
-        return []
+        return [], None
+
+    def _validate_query(self, query: str):
+        """
+        Reject malformed read() queries before any network call.
+
+        PostHog read() queries are endpoint paths, so a precompiled pattern
+        catches SQL text, spaces in the path and empty strings locally instead of
+        paying a roundtrip for a 404.
+
+        Raises:
+            QuerySyntaxError: If query is not an endpoint path
+        """
+        if not isinstance(query, str) or _ENDPOINT_PATTERN.fullmatch(query) is None:
+            raise QuerySyntaxError(
+                f"Invalid query {query!r}: expected an endpoint path",
+                details={
+                    "query": query,
+                    "expected": "Endpoint path, e.g. '/dashboards' or 'environments/{project_id}/events/'",
+                    "available": self.OBJECTS,
+                    "suggestion": "Use read('/<resource>') with a name from list_objects()",
+                },
+            )
+
+    def _object_url(self, object_name: str, record_id: Optional[str] = None) -> str:
+        """Full URL of a resource collection, or of one record in it."""
+        url = f"{self._env_prefix}{object_name}/"
+        if record_id is not None:
+            url = f"{url}{record_id}/"
+        return url
+
+    def _fetch_record(self, object_name: str, record_id: str) -> Dict[str, Any]:
+        """
+        Fetch a single resource by ID (used by batch_read()).
+
+        PostHog has no generic bulk lookup endpoint, so batch_read() fans
+        these requests out concurrently over the pooled session.
+
+        Args:
+            object_name: Resource type
+            record_id: Resource ID
+
+        Returns:
+            Resource data
+
+        Raises:
+            ObjectNotFoundError: If resource type or resource doesn't exist
+        """
+        self._ensure_validated()
+
+        if object_name not in self._OBJECTS_SET:
+            raise ObjectNotFoundError(
+                f"Object type '{object_name}' not found",
+                details={"requested": object_name, "available": self.OBJECTS},
+            )
+
+        url = self._object_url(object_name, record_id)
+
+        response = self._request_with_retry("GET", url)
+        self._check_response(response, object_name, object_name, record_id)
+
+        return _json_loads(response.content)
 
     def _validate_connection(self):
         """
@@ -1077,10 +1885,16 @@ class PostHogDriver(BaseDriver):
                 },
             )
 
+        # Already validated by an earlier driver (debug mode always probes,
+        # so connection problems show up in the log)
+        cache_key = (self.api_url, hash(self.api_key))
+        if cache_key in self._validated_keys and not self.debug:
+            return
+
         try:
             # Test connection by making a simple list request
-            test_url = urljoin(self.api_url, "environments/")
-            response = self.session.get(test_url, timeout=self.timeout)
+            test_url = self._base + "environments/"
+            response = self._request_with_retry("GET", test_url)
 
             if response.status_code == 401:
                 raise AuthenticationError(
@@ -1092,7 +1906,8 @@ class PostHogDriver(BaseDriver):
                     },
                 )
 
-            response.raise_for_status()
+            _check_status(response)
+            PostHogDriver._validated_keys.add(cache_key)
 
             if self.debug:
                 self.logger.debug("PostHog API connection validated successfully")
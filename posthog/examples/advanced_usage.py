@@ -21,16 +21,43 @@ Usage:
 
 from posthog_driver import PostHogDriver, DriverError, RateLimitError
 import time
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, islice
+from typing import NamedTuple
 
 
-def example_combined_operations():
-    """Combine read, filter, and write operations."""
-    print("\n" + "=" * 70)
-    print("1. Combined Operations: Read → Filter → Create")
-    print("=" * 70)
+_BAR = "=" * 70
+_RULE = "  " + "-" * 66
+
+
+def _banner(title):
+    """Print a section banner in one write."""
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
+
+
+def filter_records(records, field, excludes=("test",)):
+    """Drop records whose `field` contains any of `excludes` (case-insensitive)."""
+    excludes = tuple(e.lower() for e in excludes)
+    return [
+        record for record in records
+        if not any(e in (record.get(field) or "").lower() for e in excludes)
+    ]
+
+
+class OpMetric(NamedTuple):
+    """One monitored operation (see example_monitoring_and_logging)."""
 
-    driver = PostHogDriver.from_env()
+    name: str
+    status: str
+    timestamp: str
+    duration_ns: int = 0
+    error: str = ""
+
+
+def example_combined_operations(driver):
+    """Combine read, filter, and write operations."""
+    _banner("1. Combined Operations: Read → Filter → Create")
 
     try:
         print("  Scenario: Copy dashboards with specific naming pattern")
@@ -43,7 +70,7 @@ def example_combined_operations():
 
         # Filter dashboards
         print(f"\n  Step 2: Filtering dashboards...")
-        filtered = [d for d in dashboards if "test" not in d.get("name", "").lower()]
+        filtered = filter_records(dashboards, "name", excludes=("test",))
         print(f"    Filtered: {len(filtered)} dashboards (excluded test dashboards)")
 
         # Create summary
@@ -57,17 +84,10 @@ def example_combined_operations():
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
-def example_advanced_filtering_and_aggregation():
+def example_advanced_filtering_and_aggregation(driver):
     """Demonstrate advanced filtering and aggregation during batch processing."""
-    print("\n" + "=" * 70)
-    print("2. Advanced Filtering and Aggregation")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("2. Advanced Filtering and Aggregation")
 
     try:
         print("  Scenario: Process events and build analytics")
@@ -76,72 +96,53 @@ def example_advanced_filtering_and_aggregation():
         # Statistics to collect
         stats = {
             "total_events": 0,
-            "event_types": {},
+            "event_types": Counter(),
             "processed_batches": 0,
             "start_time": time.time(),
         }
 
         print("  Processing events in batches...")
 
-        for batch in driver.read_batched("/events", batch_size=100):
-            stats["processed_batches"] += 1
-
-            # Process each event
-            for event in batch:
-                event_type = event.get("event", "unknown")
-
-                # Aggregate
-                if event_type not in stats["event_types"]:
-                    stats["event_types"][event_type] = {
-                        "count": 0,
-                        "first_seen": None,
-                        "last_seen": None,
-                    }
+        batch_size = 100
 
-                stats["event_types"][event_type]["count"] += 1
-                stats["total_events"] += 1
+        # Stop after 5 batches for demo; chain the batches into one stream
+        # of events so Counter consumes them without a per-batch loop
+        batches = islice(driver.read_batched("/events", batch_size=batch_size), 5)
+        events = chain.from_iterable(batches)
+        stats["event_types"].update(event.get("event", "unknown") for event in events)
 
-            # Stop after 5 batches for demo
-            if stats["processed_batches"] >= 5:
-                break
+        stats["total_events"] = sum(stats["event_types"].values())
+        stats["processed_batches"] = -(-stats["total_events"] // batch_size)
 
         elapsed = time.time() - stats["start_time"]
 
-        # Display results
-        print(f"\n  ✓ Statistics Collected:")
-        print(f"    Total events: {stats['total_events']}")
-        print(f"    Batches processed: {stats['processed_batches']}")
-        print(f"    Event types found: {len(stats['event_types'])}")
-        print(f"    Time elapsed: {elapsed:.2f}s")
+        # Display results (built up and written in one go)
+        report = [
+            f"\n  ✓ Statistics Collected:",
+            f"    Total events: {stats['total_events']}",
+            f"    Batches processed: {stats['processed_batches']}",
+            f"    Event types found: {len(stats['event_types'])}",
+            f"    Time elapsed: {elapsed:.2f}s",
+        ]
 
         if stats["event_types"]:
-            print(f"\n  Top event types:")
-            sorted_types = sorted(
-                stats["event_types"].items(),
-                key=lambda x: x[1]["count"],
-                reverse=True
-            )
-            for event_type, data in sorted_types[:5]:
-                percentage = (data["count"] / stats["total_events"]) * 100
-                print(f"    - {event_type}: {data['count']} ({percentage:.1f}%)")
+            report.append(f"\n  Top event types:")
+            for event_type, count in stats["event_types"].most_common(5):
+                percentage = (count / stats["total_events"]) * 100
+                report.append(f"    - {event_type}: {count} ({percentage:.1f}%)")
+
+        print("\n".join(report))
 
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
-def example_performance_optimization():
+def example_performance_optimization(driver):
     """Demonstrate performance optimization techniques."""
-    print("\n" + "=" * 70)
-    print("3. Performance Optimization")
-    print("=" * 70)
+    _banner("3. Performance Optimization")
 
     print("  Technique 1: Batch Size Optimization")
-    print("  " + "-" * 66)
-
-    driver = PostHogDriver.from_env()
+    print(_RULE)
 
     try:
         batch_sizes = [10, 50, 100]
@@ -165,7 +166,7 @@ def example_performance_optimization():
                   f"in {elapsed:.3f}s ({rate:.0f} events/sec)")
 
         print(f"\n  Technique 2: Query Optimization")
-        print("  " + "-" * 66)
+        print(_RULE)
 
         # Read with optimized limit
         print(f"  Reading dashboards with optimized pagination...")
@@ -177,15 +178,10 @@ def example_performance_optimization():
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
 def example_debug_mode_troubleshooting():
     """Demonstrate debug mode for troubleshooting."""
-    print("\n" + "=" * 70)
-    print("4. Debug Mode for Troubleshooting")
-    print("=" * 70)
+    _banner("4. Debug Mode for Troubleshooting")
 
     try:
         print("  Creating driver with debug=True...")
@@ -203,13 +199,9 @@ def example_debug_mode_troubleshooting():
         print(f"  ✗ Error: {e}")
 
 
-def example_custom_endpoint_calls():
+def example_custom_endpoint_calls(driver):
     """Demonstrate direct endpoint calls."""
-    print("\n" + "=" * 70)
-    print("5. Custom Endpoint Calls (Low-Level Access)")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("5. Custom Endpoint Calls (Low-Level Access)")
 
     try:
         print("  Making custom endpoint call...")
@@ -241,21 +233,14 @@ def example_custom_endpoint_calls():
     except Exception as e:
         print(f"  ✗ Error in custom endpoint call: {e}")
 
-    finally:
-        driver.close()
-
 
-def example_advanced_error_recovery():
+def example_advanced_error_recovery(driver):
     """Demonstrate advanced error recovery strategies."""
-    print("\n" + "=" * 70)
-    print("6. Advanced Error Recovery Strategies")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("6. Advanced Error Recovery Strategies")
 
     try:
         print("  Strategy 1: Exponential Backoff with Retry")
-        print("  " + "-" * 66)
+        print(_RULE)
 
         max_retries = 3
         base_delay = 1
@@ -276,9 +261,10 @@ def example_advanced_error_recovery():
                     raise
 
         print(f"\n  Strategy 2: Graceful Degradation")
-        print("  " + "-" * 66)
+        print(_RULE)
 
-        # Try multiple operations in sequence, continue if one fails
+        # Try independent operations concurrently, continue if one fails
+        # (the driver is thread-safe and pools pool_size connections)
         operations = [
             ("dashboards", "/dashboards"),
             ("datasets", "/datasets"),
@@ -286,16 +272,22 @@ def example_advanced_error_recovery():
         ]
 
         successful = 0
-        for name, endpoint in operations:
-            try:
-                print(f"  Attempting to read {name}...")
-                data = driver.read(endpoint, limit=3)
-                print(f"    ✓ Success: {len(data)} items")
-                successful += 1
-
-            except Exception as e:
-                print(f"    ✗ Failed: {type(e).__name__}")
-                # Continue with next operation
+        print(f"  Reading {len(operations)} endpoints concurrently...")
+        with ThreadPoolExecutor(max_workers=len(operations)) as executor:
+            futures = {
+                executor.submit(driver.read, endpoint, limit=3): name
+                for name, endpoint in operations
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    data = future.result()
+                    print(f"    ✓ {name}: {len(data)} items")
+                    successful += 1
+
+                except Exception as e:
+                    print(f"    ✗ {name} failed: {type(e).__name__}")
+                    # Continue with the other operations
 
         print(f"\n  Summary: {successful}/{len(operations)} operations succeeded")
 
@@ -304,24 +296,23 @@ def example_advanced_error_recovery():
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
-def example_monitoring_and_logging():
+def example_monitoring_and_logging(driver):
     """Demonstrate monitoring and logging patterns."""
-    print("\n" + "=" * 70)
-    print("7. Monitoring and Logging Patterns")
-    print("=" * 70)
+    from datetime import datetime, timedelta
 
-    driver = PostHogDriver.from_env()
+    _banner("7. Monitoring and Logging Patterns")
 
     try:
         print("  Monitoring: Tracking operation metrics")
-        print("  " + "-" * 66)
+        print(_RULE)
 
+        # One wall-clock reading per scenario; operation timestamps are
+        # derived from it and the monotonic clock
+        anchor_wall = datetime.now()
+        anchor_mono = time.perf_counter_ns()
         metrics = {
-            "start_time": datetime.now(),
+            "start_time": anchor_wall,
             "operations": [],
         }
 
@@ -332,75 +323,97 @@ def example_monitoring_and_logging():
             ("read_dashboards", lambda: driver.read("/dashboards", limit=5)),
         ]
 
-        for op_name, op_func in operations_to_perform:
+        def timed(op_func):
+            start = time.perf_counter_ns()
             try:
-                start = time.time()
-                result = op_func()
-                elapsed = time.time() - start
-
-                metrics["operations"].append({
-                    "name": op_name,
-                    "status": "success",
-                    "duration": elapsed,
-                    "timestamp": datetime.now().isoformat(),
-                })
-
-                print(f"  ✓ {op_name}: {elapsed:.3f}s")
-
+                return op_func(), None, start, time.perf_counter_ns() - start
             except Exception as e:
-                metrics["operations"].append({
-                    "name": op_name,
-                    "status": "error",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                })
+                return None, e, start, time.perf_counter_ns() - start
+
+        # Operations are independent, so run them concurrently; each one
+        # still reports its own duration
+        wall_start = time.perf_counter_ns()
+        with ThreadPoolExecutor(max_workers=len(operations_to_perform)) as executor:
+            futures = {
+                executor.submit(timed, op_func): op_name
+                for op_name, op_func in operations_to_perform
+            }
+            results = [(futures[future], future) for future in as_completed(futures)]
+        wall_time = (time.perf_counter_ns() - wall_start) / 1e9
+
+        for op_name, future in results:
+            result, error, start, duration_ns = future.result()
+            timestamp = anchor_wall + timedelta(microseconds=(start - anchor_mono) / 1000)
+
+            if error is None:
+                metrics["operations"].append(OpMetric(
+                    name=op_name,
+                    status="success",
+                    timestamp=timestamp.isoformat(),
+                    duration_ns=duration_ns,
+                ))
+
+                print(f"  ✓ {op_name}: {duration_ns / 1e9:.3f}s")
 
-                print(f"  ✗ {op_name}: Error - {str(e)[:50]}")
+            else:
+                metrics["operations"].append(OpMetric(
+                    name=op_name,
+                    status="error",
+                    timestamp=timestamp.isoformat(),
+                    duration_ns=duration_ns,
+                    error=str(error),
+                ))
+
+                print(f"  ✗ {op_name}: Error - {str(error)[:50]}")
 
         # Print summary
         print(f"\n  Metrics Summary:")
         print(f"    Total operations: {len(metrics['operations'])}")
 
-        successful = sum(1 for op in metrics["operations"] if op["status"] == "success")
+        successful = sum(1 for op in metrics["operations"] if op.status == "success")
         print(f"    Successful: {successful}")
         print(f"    Failed: {len(metrics['operations']) - successful}")
 
-        total_time = sum(op.get("duration", 0) for op in metrics["operations"])
+        total_time = sum(op.duration_ns for op in metrics["operations"]) / 1e9
         print(f"    Total time: {total_time:.3f}s")
+        print(f"    Wall time (concurrent): {wall_time:.3f}s")
 
         print(f"\n  ✓ Monitoring and logging patterns demonstrated!")
 
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
 def main():
     """Run all advanced usage examples."""
-    print("=" * 70)
-    print("PostHog Driver - Advanced Usage Examples")
-    print("=" * 70)
+    print(f"{_BAR}\nPostHog Driver - Advanced Usage Examples\n{_BAR}")
+
+    # One driver for every scenario: it is validated once and keeps its
+    # pooled connections warm between examples
+    try:
+        driver = PostHogDriver.from_env()
+    except DriverError as e:
+        print(f"\n✗ Cannot create driver: {e}")
+        return
 
     try:
         # Run demonstrations in order
-        example_combined_operations()
-        example_advanced_filtering_and_aggregation()
-        example_performance_optimization()
+        example_combined_operations(driver)
+        example_advanced_filtering_and_aggregation(driver)
+        example_performance_optimization(driver)
         example_debug_mode_troubleshooting()
-        example_custom_endpoint_calls()
-        example_advanced_error_recovery()
-        example_monitoring_and_logging()
+        example_custom_endpoint_calls(driver)
+        example_advanced_error_recovery(driver)
+        example_monitoring_and_logging(driver)
 
     except KeyboardInterrupt:
         print("\n\nExamples interrupted by user")
     except Exception as e:
         print(f"\n\nUnexpected error: {e}")
+    finally:
+        driver.close()
 
-    print("\n" + "=" * 70)
-    print("All advanced usage examples completed!")
-    print("=" * 70)
+    _banner("All advanced usage examples completed!")
 
 
 if __name__ == "__main__":
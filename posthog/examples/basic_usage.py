@@ -45,8 +45,8 @@ def main():
         fields = driver.get_fields("dashboards")
         print(f"   Fields ({len(fields)}):")
         for field_name, field_info in list(fields.items())[:5]:
-            required = "required" if field_info.get("required") else "optional"
-            print(f"     - {field_name}: {field_info.get('type')} ({required})")
+            required = "required" if field_info.required else "optional"
+            print(f"     - {field_name}: {field_info.type} ({required})")
         if len(fields) > 5:
             print(f"     ... and {len(fields) - 5} more fields")
 
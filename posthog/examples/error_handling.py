@@ -20,6 +20,8 @@ Usage:
     python error_handling.py
 """
 
+from itertools import islice
+
 from posthog_driver import (
     PostHogDriver,
     AuthenticationError,
@@ -32,11 +34,17 @@ from posthog_driver import (
 )
 
 
+_BAR = "=" * 70
+
+
+def _banner(title):
+    """Print a section banner in one write."""
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
+
+
 def demonstrate_authentication_error():
     """Show how to handle authentication errors."""
-    print("\n" + "=" * 70)
-    print("1. Demonstrating Authentication Error Handling")
-    print("=" * 70)
+    _banner("1. Demonstrating Authentication Error Handling")
 
     try:
         # Try to initialize with invalid credentials
@@ -54,13 +62,9 @@ def demonstrate_authentication_error():
         print(f"  Required vars: {e.details.get('required_env_vars')}")
 
 
-def demonstrate_validation_error():
+def demonstrate_validation_error(driver):
     """Show how to handle validation errors."""
-    print("\n" + "=" * 70)
-    print("2. Demonstrating Validation Error Handling")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("2. Demonstrating Validation Error Handling")
 
     try:
         # Try to read with invalid page size
@@ -81,17 +85,10 @@ def demonstrate_validation_error():
         except Exception as e:
             print(f"  ✗ Recovery failed: {e}")
 
-    finally:
-        driver.close()
-
 
-def demonstrate_object_not_found_error():
+def demonstrate_object_not_found_error(driver):
     """Show how to handle object not found errors."""
-    print("\n" + "=" * 70)
-    print("3. Demonstrating Object Not Found Error Handling")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("3. Demonstrating Object Not Found Error Handling")
 
     try:
         # Try to get schema for non-existent object
@@ -115,17 +112,10 @@ def demonstrate_object_not_found_error():
         except Exception as e:
             print(f"  ✗ Recovery failed: {e}")
 
-    finally:
-        driver.close()
-
 
-def demonstrate_batch_operation_with_error_handling():
+def demonstrate_batch_operation_with_error_handling(driver):
     """Show how to handle errors during batch operations."""
-    print("\n" + "=" * 70)
-    print("4. Demonstrating Error Handling in Batch Operations")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("4. Demonstrating Error Handling in Batch Operations")
 
     try:
         # Process data in batches with error handling
@@ -134,23 +124,25 @@ def demonstrate_batch_operation_with_error_handling():
 
         print("  Processing events in batches...")
 
-        for batch in driver.read_batched("/events", batch_size=100):
+        # Only process first 3 batches in this demo; islice() bounds the
+        # generator, so no 4th page is fetched
+        max_batches = 3
+        for batch in islice(driver.read_batched("/events", batch_size=100), max_batches):
             try:
                 batches_processed += 1
-                total_processed += len(batch)
+                count = len(batch)
+                total_processed += count
 
                 # Simulate processing each batch
-                print(f"  ✓ Processed batch {batches_processed}: {len(batch)} events")
-
-                # Only process first 3 batches in this demo
-                if batches_processed >= 3:
-                    print(f"  (Stopping after 3 batches for demo purposes)")
-                    break
+                print(f"  ✓ Processed batch {batches_processed}: {count} events")
 
             except Exception as e:
                 print(f"  ✗ Error processing batch {batches_processed}: {e}")
                 # Continue with next batch instead of crashing
 
+        if batches_processed == max_batches:
+            print(f"  (Stopping after {max_batches} batches for demo purposes)")
+
         print(f"\n  Total processed: {total_processed} events in {batches_processed} batches")
 
     except RateLimitError as e:
@@ -163,17 +155,10 @@ def demonstrate_batch_operation_with_error_handling():
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
 
-    finally:
-        driver.close()
-
 
-def demonstrate_generic_error_handling():
+def demonstrate_generic_error_handling(driver):
     """Show how to handle any driver error generically."""
-    print("\n" + "=" * 70)
-    print("5. Demonstrating Generic Error Handling")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("5. Demonstrating Generic Error Handling")
 
     try:
         # This operation should succeed
@@ -190,32 +175,24 @@ def demonstrate_generic_error_handling():
         # Catch unexpected errors
         print(f"✗ Unexpected Error: {e}")
 
-    finally:
-        driver.close()
-
 
 def demonstrate_context_manager_pattern():
     """Show best practice using context manager pattern."""
-    print("\n" + "=" * 70)
-    print("6. Demonstrating Context Manager Pattern (Best Practice)")
-    print("=" * 70)
+    _banner("6. Demonstrating Context Manager Pattern (Best Practice)")
 
     try:
-        # Recommended: Always use try/finally pattern
-        driver = PostHogDriver.from_env()
-
-        try:
-            dashboards = driver.read("/dashboards", limit=5)
-            print(f"✓ Successfully read {len(dashboards)} dashboards")
-            print("  This code is guaranteed to cleanup resources")
+        # Recommended: a with-block closes the driver however it exits
+        with PostHogDriver.from_env() as driver:
+            try:
+                dashboards = driver.read("/dashboards", limit=5)
+                print(f"✓ Successfully read {len(dashboards)} dashboards")
+                print("  This code is guaranteed to cleanup resources")
 
-        except DriverError as e:
-            print(f"✗ Error during operation: {e.message}")
-            print(f"  Suggestion: {e.details.get('suggestion')}")
+            except DriverError as e:
+                print(f"✗ Error during operation: {e.message}")
+                print(f"  Suggestion: {e.details.get('suggestion')}")
 
-        finally:
-            driver.close()
-            print("  Resources cleaned up")
+        print("  Resources cleaned up")
 
     except Exception as e:
         print(f"✗ Failed to initialize driver: {e}")
@@ -223,17 +200,20 @@ def demonstrate_context_manager_pattern():
 
 def main():
     """Run all error handling demonstrations."""
-    print("=" * 70)
-    print("PostHog Driver - Error Handling Examples")
-    print("=" * 70)
+    print(f"{_BAR}\nPostHog Driver - Error Handling Examples\n{_BAR}")
 
     try:
         # Run demonstrations in order
         demonstrate_authentication_error()
-        demonstrate_validation_error()
-        demonstrate_object_not_found_error()
-        demonstrate_batch_operation_with_error_handling()
-        demonstrate_generic_error_handling()
+
+        # One driver for the examples below: validated once, and its pooled
+        # connections stay warm between examples; closed on exit
+        with PostHogDriver.from_env() as driver:
+            demonstrate_validation_error(driver)
+            demonstrate_object_not_found_error(driver)
+            demonstrate_batch_operation_with_error_handling(driver)
+            demonstrate_generic_error_handling(driver)
+
         demonstrate_context_manager_pattern()
 
     except KeyboardInterrupt:
@@ -241,9 +221,7 @@ def main():
     except Exception as e:
         print(f"\n\nUnexpected error in main: {e}")
 
-    print("\n" + "=" * 70)
-    print("All error handling examples completed!")
-    print("=" * 70)
+    _banner("All error handling examples completed!")
 
 
 if __name__ == "__main__":
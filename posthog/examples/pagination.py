@@ -19,68 +19,178 @@ Usage:
 """
 
 from posthog_driver import PostHogDriver, RateLimitError
+import queue
+import random
+import threading
 import time
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from operator import itemgetter
+
+
+_BAR = "=" * 70
+
+
+def _banner(title):
+    """Print a section banner in one write."""
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
+
+
+# Projection of a dashboard kept by example_pagination_with_filtering
+# (a tuple per record instead of a dict)
+DashRef = namedtuple("DashRef", "id name created")
+_dash_fields = itemgetter("id", "name", "created_at")
+
+
+def _retry_with_backoff(fn, max_attempts=7, base=0.5, cap=60):
+    """
+    Call fn(), retrying on RateLimitError with jittered exponential backoff.
+
+    Waits base * 2**attempt seconds plus up to `base` of random jitter,
+    capped at `cap` and at the server's Retry-After, so a rate limit
+    costs a short pause instead of a fixed minute.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except RateLimitError as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = min(cap, base * 2 ** attempt) + random.uniform(0, base)
+            delay = min(delay, e.details.get("retry_after", cap))
+            print(f"    Rate limited, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+def _prefetch(batches, limit=None, depth=1):
+    """
+    Iterate up to `limit` items of the `batches` generator while a
+    background thread fetches ahead.
+
+    Up to `depth` batches wait ready while the next page is already in
+    flight, so network time overlaps with processing (double buffering).
+    Errors from fetching are re-raised here; leaving the loop early
+    stops the thread, and `batches` is closed (releasing its open
+    response) once the thread is done with it.
+    """
+    ready = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for batch in islice(batches, limit):
+                if not put((batch, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+        else:
+            put((done, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch, error = ready.get()
+            if batch is done:
+                if error is not None:
+                    raise error
+                return
+            yield batch
+    finally:
+        stop.set()
+        thread.join()
+        batches.close()
 
 
-def example_manual_pagination():
+def example_manual_pagination(driver):
     """Demonstrate manual pagination using limit/offset."""
-    print("\n" + "=" * 70)
-    print("1. Manual Pagination (Limit/Offset)")
-    print("=" * 70)
+    _banner("1. Manual Pagination (Limit/Offset)")
 
-    driver = PostHogDriver.from_env()
+    page_size = 10
+    page = 1
+    total_fetched = 0
+    max_pages = 3  # Limit to 3 pages for demo
 
-    try:
-        page_size = 10
-        page = 1
-        total_fetched = 0
-        max_pages = 3  # Limit to 3 pages for demo
+    print(f"  Fetching dashboards with manual pagination (page_size={page_size})...\n")
 
-        print(f"  Fetching dashboards with manual pagination (page_size={page_size})...\n")
+    # Explicit offsets suit jumping to a given page. To walk a whole
+    # collection, prefer read_batched()/iter_read(): they follow the
+    # "next" link of each page instead of recomputing offsets.
+    while page <= max_pages:
+        offset = (page - 1) * page_size
 
-        while page <= max_pages:
-            offset = (page - 1) * page_size
+        # Fetch one page (retried with backoff if rate limited)
+        dashboards = _retry_with_backoff(
+            lambda: driver.read("/dashboards", limit=page_size, offset=offset)
+        )
 
-            try:
-                # Fetch one page
-                dashboards = driver.read("/dashboards", limit=page_size, offset=offset)
+        if not dashboards:
+            print(f"  Page {page}: No more data")
+            break
 
-                if not dashboards:
-                    print(f"  Page {page}: No more data")
-                    break
+        print(f"  Page {page} (offset {offset}): {len(dashboards)} dashboards")
 
-                print(f"  Page {page} (offset {offset}): {len(dashboards)} dashboards")
+        # One write for the whole page rather than a print per record
+        print("\n".join(
+            f"    {i}. {dashboard.get('name', 'Unnamed')}"
+            for i, dashboard in enumerate(dashboards, 1)
+        ))
 
-                for i, dashboard in enumerate(dashboards, 1):
-                    print(f"    {i}. {dashboard.get('name', 'Unnamed')}")
+        total_fetched += len(dashboards)
+        page += 1
 
-                total_fetched += len(dashboards)
-                page += 1
+        # Small delay between requests (good practice)
+        time.sleep(0.1)
 
-                # Small delay between requests (good practice)
-                time.sleep(0.1)
+    print(f"\n  Total fetched: {total_fetched} dashboards")
 
-            except RateLimitError as e:
-                print(f"  ✗ Rate limited on page {page}")
-                retry_after = e.details.get('retry_after', 60)
-                print(f"    Waiting {retry_after} seconds before retry...")
-                time.sleep(retry_after)
-                # Retry this page
-                continue
 
-        print(f"\n  Total fetched: {total_fetched} dashboards")
+def _tune_page_size(driver, query, start=25):
+    """
+    Find a page size for `query` by doubling while throughput improves.
 
-    finally:
-        driver.close()
+    Times the first batch read_batched() yields at each size (it follows
+    the "next" link of each page, so no offsets are re-scanned), doubling
+    the size while records per second rise by more than 10%, up to the
+    API's max_page_size.
+    """
+    max_size = driver.get_capabilities().max_page_size or 100
+    size, last_rate = start, 0.0
 
+    while True:
+        batches = driver.read_batched(query, batch_size=size)
+        try:
+            start_time = time.perf_counter()
+            records = next(batches, [])
+            elapsed = time.perf_counter() - start_time
+        finally:
+            batches.close()
+        if not records:
+            return size
 
-def example_batched_reading():
-    """Demonstrate efficient batched reading."""
-    print("\n" + "=" * 70)
-    print("2. Batched Reading (Memory Efficient)")
-    print("=" * 70)
+        rate = len(records) / elapsed if elapsed > 0 else float("inf")
+        print(f"    batch_size={size:3d}: {rate:.0f} events/sec")
+        if rate <= last_rate * 1.1 or size >= max_size or len(records) < size:
+            return size if rate > last_rate else max(start, size // 2)
+
+        last_rate = rate
+        size = min(size * 2, max_size)
 
-    driver = PostHogDriver.from_env()
+
+def example_batched_reading(driver):
+    """Demonstrate efficient batched reading."""
+    _banner("2. Batched Reading (Memory Efficient)")
 
     try:
         batch_size = 100
@@ -90,24 +200,29 @@ def example_batched_reading():
 
         print(f"  Processing events with batched reading (batch_size={batch_size})...\n")
 
-        for batch in driver.read_batched("/events", batch_size=batch_size):
+        # Process first 3 batches only (for demo); the limit bounds the
+        # generator itself, so no 4th page is fetched (or prefetched). The
+        # next batch is fetched in the background while this one is
+        # processed.
+        max_batches = 3
+        events = driver.read_batched("/events", batch_size=batch_size)
+        for batch in _prefetch(events, max_batches):
             start_time = time.time()
             batches += 1
+            count = len(batch)
 
             # Process batch
-            total_processed += len(batch)
+            total_processed += count
             batch_duration = time.time() - start_time
 
             # Track timing
             batch_times.append(batch_duration)
 
             # Show progress
-            print(f"  Batch {batches}: {len(batch)} events (processed in {batch_duration:.3f}s)")
+            print(f"  Batch {batches}: {count} events (processed in {batch_duration:.3f}s)")
 
-            # Process first 3 batches only (for demo)
-            if batches >= 3:
-                print(f"  (Stopping after 3 batches for demo)")
-                break
+        if batches == max_batches:
+            print(f"  (Stopping after {max_batches} batches for demo)")
 
         if batch_times:
             avg_time = sum(batch_times) / len(batch_times)
@@ -116,43 +231,45 @@ def example_batched_reading():
             print(f"    Total events: {total_processed}")
             print(f"    Avg time per batch: {avg_time:.3f}s")
 
+        # The best page size depends on the endpoint: small pages pay more
+        # per-request overhead, large ones cost memory and latency per
+        # page. Double the size while throughput keeps improving by >10%.
+        print(f"\n  Tuning batch size for /events...")
+        page_size = _tune_page_size(driver, "/events")
+        print(f"    Recommended batch_size for /events: {page_size}")
+
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
-def example_batched_filtering_and_aggregation():
+def example_batched_filtering_and_aggregation(driver):
     """Demonstrate filtering and aggregating data during batch processing."""
-    print("\n" + "=" * 70)
-    print("3. Filtering and Aggregating During Batch Processing")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("3. Filtering and Aggregating During Batch Processing")
 
     try:
         print("  Processing events and tracking by event type...\n")
 
-        event_counts = {}
+        event_counts = Counter()
         total_events = 0
         batches_processed = 0
 
-        for batch in driver.read_batched("/events", batch_size=100):
+        # Stop after 5 batches for demo (bounded at the source, so no 6th
+        # page is fetched). The next batch is fetched in the background
+        # while this one is aggregated.
+        max_batches = 5
+        events = driver.read_batched("/events", batch_size=100)
+        for batch in _prefetch(events, max_batches):
             batches_processed += 1
+            count = len(batch)
 
-            # Filter and aggregate
-            for event in batch:
-                event_type = event.get("event", "unknown")
-                event_counts[event_type] = event_counts.get(event_type, 0) + 1
-                total_events += 1
+            # Filter and aggregate (Counter counts the whole batch in C)
+            event_counts.update(event.get("event", "unknown") for event in batch)
+            total_events += count
 
-            print(f"  Processed batch {batches_processed}: {len(batch)} events")
+            print(f"  Processed batch {batches_processed}: {count} events")
 
-            # Stop after 5 batches for demo
-            if batches_processed >= 5:
-                print(f"  (Stopping after 5 batches for demo)")
-                break
+        if batches_processed == max_batches:
+            print(f"  (Stopping after {max_batches} batches for demo)")
 
         # Show results
         print(f"\n  Summary:")
@@ -162,93 +279,74 @@ def example_batched_filtering_and_aggregation():
 
         if event_counts:
             print(f"\n  Top event types:")
-            sorted_events = sorted(
-                event_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            for event_type, count in sorted_events[:5]:
+            # Only the top 5 are selected (a heap), not every type sorted
+            top_events = event_counts.most_common(5)
+            for event_type, count in top_events:
                 percentage = (count / total_events) * 100
                 print(f"    - {event_type}: {count} ({percentage:.1f}%)")
-            if len(sorted_events) > 5:
-                print(f"    ... and {len(sorted_events) - 5} more event types")
+            remaining = len(event_counts) - len(top_events)
+            if remaining:
+                print(f"    ... and {remaining} more event types")
 
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
 
+def _stream_filtered(driver, cutoff, page_size=20):
+    """
+    Yield a DashRef for each dashboard created at or after `cutoff`.
+
+    iter_read() follows the "next" link PostHog returns with each page
+    rather than computing offsets, and requests a page only as records
+    are consumed; each page is dropped once filtered, so memory stays at
+    one page no matter how many dashboards exist.
+    """
+    for dashboard in driver.iter_read("/dashboards", page_size=page_size):
+        try:
+            # One C-level fetch of all three fields (API records have them)
+            ref = DashRef._make(_dash_fields(dashboard))
+        except KeyError:
+            ref = DashRef(
+                dashboard.get("id"),
+                dashboard.get("name"),
+                dashboard.get("created_at"),
+            )
+        if (ref.created or "") >= cutoff:
+            yield ref
 
-def example_pagination_with_filtering():
-    """Demonstrate pagination with filtering."""
-    print("\n" + "=" * 70)
-    print("4. Pagination with Filtering")
-    print("=" * 70)
 
-    driver = PostHogDriver.from_env()
+def example_pagination_with_filtering(driver):
+    """Demonstrate pagination with filtering."""
+    _banner("4. Pagination with Filtering")
 
     try:
-        print("  Reading dashboards and filtering by creation date...\n")
-
-        page_size = 20
-        offset = 0
-        dashboards_created_recently = []
-        total_checked = 0
-
-        while True:
-            try:
-                dashboards = driver.read("/dashboards", limit=page_size, offset=offset)
-
-                if not dashboards:
-                    print(f"  No more dashboards")
-                    break
-
-                total_checked += len(dashboards)
-                print(f"  Checking {len(dashboards)} dashboards...")
-
-                # Filter: Keep dashboards (simulate filtering)
-                for dashboard in dashboards:
-                    dashboards_created_recently.append({
-                        "id": dashboard.get("id"),
-                        "name": dashboard.get("name"),
-                        "created": dashboard.get("created_at"),
-                    })
+        print("  Reading dashboards and filtering by creation date...")
 
-                # Process only first 2 pages for demo
-                offset += page_size
-                if offset >= (page_size * 2):
-                    print(f"  (Stopping after 2 pages for demo)")
-                    break
+        # PostHog's dashboard list has no creation-date filter, so the
+        # predicate runs here. Endpoints that filter server-side take the
+        # parameters in the query string, e.g. driver.read(f"/events?after={cutoff}").
+        # ISO 8601 timestamps in UTC compare correctly as strings.
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%S")
+        wanted = 3
 
-                time.sleep(0.1)  # Rate limit friendly
-
-            except RateLimitError:
-                print(f"  Rate limited, waiting...")
-                time.sleep(60)
+        # Pull matches through the pipeline until enough are found; no
+        # further pages are requested after that
+        recent = list(islice(_stream_filtered(driver, cutoff), wanted))
 
         print(f"\n  Results:")
-        print(f"    Total dashboards checked: {total_checked}")
-        print(f"    Dashboards kept: {len(dashboards_created_recently)}")
-        if dashboards_created_recently:
+        print(f"    Created in the last 30 days: {len(recent)} (stopping at {wanted})")
+        if recent:
             print(f"\n    Sample dashboards:")
-            for i, dashboard in enumerate(dashboards_created_recently[:3], 1):
-                print(f"      {i}. {dashboard['name']} (created: {dashboard['created']})")
+            for i, dashboard in enumerate(recent, 1):
+                print(f"      {i}. {dashboard.name} (created: {dashboard.created})")
 
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
-def example_rate_limit_aware_pagination():
+def example_rate_limit_aware_pagination(driver):
     """Demonstrate rate limit aware pagination with delays."""
-    print("\n" + "=" * 70)
-    print("5. Rate Limit Aware Pagination")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("5. Rate Limit Aware Pagination")
 
     try:
         batch_size = 50
@@ -260,27 +358,29 @@ def example_rate_limit_aware_pagination():
         print(f"  - Batch size: {batch_size}")
         print(f"  - Delay between requests: {delay_between_requests}s\n")
 
-        for batch in driver.read_batched("/events", batch_size=batch_size):
+        # Stop after 3 requests for demo (islice() bounds the generator, so
+        # no 4th page is requested)
+        max_requests = 3
+        for batch in islice(driver.read_batched("/events", batch_size=batch_size), max_requests):
             requests_made += 1
-            total_processed += len(batch)
+            count = len(batch)
+            total_processed += count
 
-            print(f"  Request {requests_made}: {len(batch)} events (total: {total_processed})")
+            print(f"  Request {requests_made}: {count} events (total: {total_processed})")
 
             # Check rate limit status
             rate_limit = driver.get_rate_limit_status()
-            if rate_limit["remaining"] is not None:
-                print(f"    Rate limit status: {rate_limit['remaining']} remaining")
-
-            # Stop after 3 requests for demo
-            if requests_made >= 3:
-                print(f"  (Stopping after 3 requests for demo)")
-                break
+            if rate_limit.remaining is not None:
+                print(f"    Rate limit status: {rate_limit.remaining} remaining")
 
             # Add delay between requests
-            if requests_made < 3:
+            if requests_made < max_requests:
                 print(f"    Waiting {delay_between_requests}s...")
                 time.sleep(delay_between_requests)
 
+        if requests_made == max_requests:
+            print(f"  (Stopping after {max_requests} requests for demo)")
+
         print(f"\n  Summary:")
         print(f"    Total requests: {requests_made}")
         print(f"    Total events: {total_processed}")
@@ -288,32 +388,28 @@ def example_rate_limit_aware_pagination():
     except Exception as e:
         print(f"  ✗ Error: {e}")
 
-    finally:
-        driver.close()
-
 
 def main():
     """Run all pagination examples."""
-    print("=" * 70)
-    print("PostHog Driver - Pagination Examples")
-    print("=" * 70)
+    print(f"{_BAR}\nPostHog Driver - Pagination Examples\n{_BAR}")
 
     try:
-        # Run demonstrations in order
-        example_manual_pagination()
-        example_batched_reading()
-        example_batched_filtering_and_aggregation()
-        example_pagination_with_filtering()
-        example_rate_limit_aware_pagination()
+        # One driver for every example: validated once, and its pooled
+        # connections stay warm between examples; closed on exit
+        with PostHogDriver.from_env() as driver:
+            # Run demonstrations in order
+            example_manual_pagination(driver)
+            example_batched_reading(driver)
+            example_batched_filtering_and_aggregation(driver)
+            example_pagination_with_filtering(driver)
+            example_rate_limit_aware_pagination(driver)
 
     except KeyboardInterrupt:
         print("\n\nExamples interrupted by user")
     except Exception as e:
         print(f"\n\nUnexpected error: {e}")
 
-    print("\n" + "=" * 70)
-    print("All pagination examples completed!")
-    print("=" * 70)
+    _banner("All pagination examples completed!")
 
 
 if __name__ == "__main__":
@@ -20,6 +20,8 @@ Usage:
     python write_operations.py
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from posthog_driver import (
     PostHogDriver,
     ValidationError,
@@ -28,13 +30,17 @@ from posthog_driver import (
 )
 
 
-def example_create_resource():
-    """Demonstrate creating a new resource."""
-    print("\n" + "=" * 70)
-    print("1. Creating a New Resource (Dashboard)")
-    print("=" * 70)
+_BAR = "=" * 70
+
 
-    driver = PostHogDriver.from_env()
+def _banner(title):
+    """Print a section banner in one write."""
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
+
+
+def example_create_resource(driver):
+    """Demonstrate creating a new resource."""
+    _banner("1. Creating a New Resource (Dashboard)")
 
     try:
         # Create a new dashboard
@@ -65,17 +71,10 @@ def example_create_resource():
         print(f"  ✗ Error creating dashboard: {e.message}")
         return None
 
-    finally:
-        driver.close()
-
 
-def example_read_resource():
+def example_read_resource(driver):
     """Demonstrate reading a resource."""
-    print("\n" + "=" * 70)
-    print("2. Reading Existing Resources")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("2. Reading Existing Resources")
 
     try:
         print("  Reading first 5 dashboards...")
@@ -83,8 +82,10 @@ def example_read_resource():
         dashboards = driver.read("/dashboards", limit=5)
 
         print(f"\n  ✓ Found {len(dashboards)} dashboards:")
-        for i, dashboard in enumerate(dashboards, 1):
-            print(f"    {i}. {dashboard.get('name')} (ID: {dashboard.get('id')})")
+        print("\n".join(
+            f"    {i}. {dashboard.get('name')} (ID: {dashboard.get('id')})"
+            for i, dashboard in enumerate(dashboards, 1)
+        ))
 
         return dashboards[0].get('id') if dashboards else None
 
@@ -92,17 +93,10 @@ def example_read_resource():
         print(f"  ✗ Error reading dashboards: {e.message}")
         return None
 
-    finally:
-        driver.close()
-
 
-def example_update_resource(dashboard_id=None):
+def example_update_resource(driver, dashboard_id=None):
     """Demonstrate updating a resource."""
-    print("\n" + "=" * 70)
-    print("3. Updating an Existing Resource")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("3. Updating an Existing Resource")
 
     try:
         # Get a dashboard to update
@@ -145,17 +139,10 @@ def example_update_resource(dashboard_id=None):
         print(f"  ✗ Error updating dashboard: {e.message}")
         return False
 
-    finally:
-        driver.close()
-
 
-def example_delete_resource(dashboard_id=None):
+def example_delete_resource(driver, dashboard_id=None):
     """Demonstrate deleting a resource."""
-    print("\n" + "=" * 70)
-    print("4. Deleting a Resource (Soft Delete)")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("4. Deleting a Resource (Soft Delete)")
 
     try:
         # Get a dashboard to delete (optional)
@@ -187,68 +174,62 @@ def example_delete_resource(dashboard_id=None):
         print(f"  ✗ Error deleting dashboard: {e.message}")
         return False
 
-    finally:
-        driver.close()
-
 
-def example_batch_create():
+def example_batch_create(driver):
     """Demonstrate creating multiple resources."""
-    print("\n" + "=" * 70)
-    print("5. Batch Create Operations")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
-
-    try:
-        # Define multiple dashboards to create
-        dashboards_to_create = [
-            {"name": "Sales Dashboard", "description": "Sales metrics"},
-            {"name": "Marketing Dashboard", "description": "Marketing KPIs"},
-            {"name": "Analytics Dashboard", "description": "User analytics"},
-        ]
-
-        print(f"  Creating {len(dashboards_to_create)} dashboards in batch...\n")
-
-        created = []
-        failed = []
-
-        for dashboard_data in dashboards_to_create:
+    _banner("5. Batch Create Operations")
+
+    # Define multiple dashboards to create
+    dashboards_to_create = [
+        {"name": "Sales Dashboard", "description": "Sales metrics"},
+        {"name": "Marketing Dashboard", "description": "Marketing KPIs"},
+        {"name": "Analytics Dashboard", "description": "User analytics"},
+    ]
+
+    print(f"  Creating {len(dashboards_to_create)} dashboards in batch...\n")
+
+    created = []
+    failed = []
+
+    # Each create is an independent request, so send them concurrently
+    # (driver.batch_write() does the same, but stops at the first failure)
+    with ThreadPoolExecutor(max_workers=min(8, len(dashboards_to_create))) as executor:
+        futures = {
+            executor.submit(driver.create, "dashboards", dashboard_data): dashboard_data
+            for dashboard_data in dashboards_to_create
+        }
+        for future in as_completed(futures):
+            dashboard_data = futures[future]
             try:
-                print(f"  Creating: {dashboard_data['name']}")
-                dashboard = driver.create("dashboards", dashboard_data)
+                dashboard = future.result()
                 created.append(dashboard)
-                print(f"    ✓ Created with ID: {dashboard.get('id')}")
+                print(f"  ✓ Created {dashboard_data['name']} with ID: {dashboard.get('id')}")
 
             except ValidationError as e:
-                print(f"    ✗ Validation Error: {e.message}")
+                print(f"  ✗ {dashboard_data['name']}: Validation Error: {e.message}")
                 failed.append((dashboard_data, str(e)))
 
             except DriverError as e:
-                print(f"    ✗ Error: {e.message}")
+                print(f"  ✗ {dashboard_data['name']}: Error: {e.message}")
                 failed.append((dashboard_data, str(e)))
 
-        print(f"\n  Summary:")
-        print(f"    Successfully created: {len(created)}")
-        print(f"    Failed: {len(failed)}")
+    print(f"\n  Summary:")
+    print(f"    Successfully created: {len(created)}")
+    print(f"    Failed: {len(failed)}")
 
-        if created:
-            print(f"\n  Created dashboards:")
-            for dashboard in created:
-                print(f"    - {dashboard.get('name')} (ID: {dashboard.get('id')})")
+    if created:
+        print(f"\n  Created dashboards:")
+        print("\n".join(
+            f"    - {dashboard.get('name')} (ID: {dashboard.get('id')})"
+            for dashboard in created
+        ))
 
-        return len(created) > 0
+    return len(created) > 0
 
-    finally:
-        driver.close()
 
-
-def example_crud_workflow():
+def example_crud_workflow(driver):
     """Demonstrate complete CRUD workflow."""
-    print("\n" + "=" * 70)
-    print("6. Complete CRUD Workflow")
-    print("=" * 70)
-
-    driver = PostHogDriver.from_env()
+    _banner("6. Complete CRUD Workflow")
 
     try:
         # CREATE
@@ -288,87 +269,75 @@ def example_crud_workflow():
         print(f"  ✗ Error in CRUD workflow: {e}")
         return False
 
-    finally:
-        driver.close()
 
-
-def example_error_handling_in_writes():
+def example_error_handling_in_writes(driver):
     """Demonstrate error handling during write operations."""
-    print("\n" + "=" * 70)
-    print("7. Error Handling in Write Operations")
-    print("=" * 70)
+    _banner("7. Error Handling in Write Operations")
 
-    driver = PostHogDriver.from_env()
+    # Try to create with missing required field
+    print("  Attempting to create dashboard without required field...")
+    try:
+        invalid_data = {
+            "description": "Missing name field"
+            # 'name' is missing!
+        }
+        dashboard = driver.create("dashboards", invalid_data)
 
+    except ValidationError as e:
+        print(f"    ✓ Validation Error Caught (expected!)")
+        print(f"      Message: {e.message}")
+        if "missing_fields" in e.details:
+            print(f"      Missing: {e.details['missing_fields']}")
+
+    # Try to update non-existent resource
+    print(f"\n  Attempting to update non-existent dashboard...")
     try:
-        # Try to create with missing required field
-        print("  Attempting to create dashboard without required field...")
-        try:
-            invalid_data = {
-                "description": "Missing name field"
-                # 'name' is missing!
-            }
-            dashboard = driver.create("dashboards", invalid_data)
-
-        except ValidationError as e:
-            print(f"    ✓ Validation Error Caught (expected!)")
-            print(f"      Message: {e.message}")
-            if "missing_fields" in e.details:
-                print(f"      Missing: {e.details['missing_fields']}")
-
-        # Try to update non-existent resource
-        print(f"\n  Attempting to update non-existent dashboard...")
-        try:
-            updated = driver.update("dashboards", "nonexistent_id", {"name": "Updated"})
-
-        except ObjectNotFoundError as e:
-            print(f"    ✓ Object Not Found Error Caught (expected!)")
-            print(f"      Message: {e.message}")
-
-        # Try to delete non-existent resource
-        print(f"\n  Attempting to delete non-existent dashboard...")
-        try:
-            success = driver.delete("dashboards", "nonexistent_id")
-
-        except ObjectNotFoundError as e:
-            print(f"    ✓ Object Not Found Error Caught (expected!)")
-            print(f"      Message: {e.message}")
-
-        print(f"\n  ✓ Error handling in write operations verified!")
+        updated = driver.update("dashboards", "nonexistent_id", {"name": "Updated"})
 
-        return True
+    except ObjectNotFoundError as e:
+        print(f"    ✓ Object Not Found Error Caught (expected!)")
+        print(f"      Message: {e.message}")
+
+    # Try to delete non-existent resource
+    print(f"\n  Attempting to delete non-existent dashboard...")
+    try:
+        success = driver.delete("dashboards", "nonexistent_id")
+
+    except ObjectNotFoundError as e:
+        print(f"    ✓ Object Not Found Error Caught (expected!)")
+        print(f"      Message: {e.message}")
+
+    print(f"\n  ✓ Error handling in write operations verified!")
 
-    finally:
-        driver.close()
+    return True
 
 
 def main():
     """Run all write operation examples."""
-    print("=" * 70)
-    print("PostHog Driver - Write Operations Examples")
-    print("=" * 70)
+    print(f"{_BAR}\nPostHog Driver - Write Operations Examples\n{_BAR}")
 
     try:
-        # Run demonstrations in order
-        example_create_resource()
-        dashboard_id = example_read_resource()
+        # One driver for every example: validated once, and its pooled
+        # connections stay warm between examples; closed on exit
+        with PostHogDriver.from_env() as driver:
+            # Run demonstrations in order
+            example_create_resource(driver)
+            dashboard_id = example_read_resource(driver)
 
-        if dashboard_id:
-            example_update_resource(dashboard_id)
-            example_delete_resource(dashboard_id)
+            if dashboard_id:
+                example_update_resource(driver, dashboard_id)
+                example_delete_resource(driver, dashboard_id)
 
-        example_batch_create()
-        example_crud_workflow()
-        example_error_handling_in_writes()
+            example_batch_create(driver)
+            example_crud_workflow(driver)
+            example_error_handling_in_writes(driver)
 
     except KeyboardInterrupt:
         print("\n\nExamples interrupted by user")
     except Exception as e:
         print(f"\n\nUnexpected error: {e}")
 
-    print("\n" + "=" * 70)
-    print("All write operation examples completed!")
-    print("=" * 70)
+    _banner("All write operation examples completed!")
 
 
 if __name__ == "__main__":